@@ -1,15 +1,36 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
+
+sys.path.insert(0, SPECPATH)
+from asset_pack import ASSET_PACK_PATH, AssetPack
+
+# 에셋 팩(`python asset_pack.py`로 생성)이 있으면 팩과, 팩이 대신하지 않는 assets/ 파일만 넣습니다.
+# 팩이 없으면 assets/ 폴더를 통째로 넣고 게임은 개별 파일을 읽습니다.
+pack_path = os.path.join(SPECPATH, ASSET_PACK_PATH)
+if os.path.isfile(pack_path):
+    packed_sources = set(AssetPack(pack_path).sources())
+    asset_datas = [(ASSET_PACK_PATH, '.')]
+    for directory, _, filenames in os.walk(os.path.join(SPECPATH, 'assets')):
+        relative_dir = os.path.relpath(directory, SPECPATH)
+        for filename in filenames:
+            path = os.path.join(relative_dir, filename)
+            if path.replace(os.sep, '/') not in packed_sources:
+                asset_datas.append((path, relative_dir))
+    print(f"에셋 팩 사용: 팩이 대신하는 파일 {len(packed_sources)}개는 넣지 않습니다.")
+else:
+    asset_datas = [('assets', 'assets')]
+    print(f"{ASSET_PACK_PATH}가 없어 assets/ 폴더를 그대로 넣습니다. (`python asset_pack.py`로 만들 수 있습니다)")
 
 
 a = Analysis(
     ['game_core.py'],
     pathex=[],
     binaries=[],
-    datas=[
-        ('assets', 'assets'),
+    datas=asset_datas + [
         ('final_animal_blocks.json', '.'),
         ('ranking.json', '.'),  # <-- 이 항목이 있는지 확인!
-    ],  # 이렇게 수정해주세요!
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -21,20 +42,18 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# 폴더 배포(onedir): 데이터는 EXE에 넣지 않고 COLLECT가 실행 파일 옆에 풀어 둡니다.
+# 에셋 팩을 실행할 때마다 임시 폴더로 풀지 않고 그 자리에서 mmap으로 엽니다.
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='AnimalBridge',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,  # <-- False를 True로 수정!
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -45,6 +64,7 @@ exe = EXE(
 coll = COLLECT(
     exe,
     a.binaries,
+    a.zipfiles,
     a.datas,
     strip=False,
     upx=True,
@@ -0,0 +1,144 @@
+# asset_cache.py
+
+import pygame
+from collections import OrderedDict
+from settings import resource_path
+from texture_atlas import load_sprite, normalize_name, get_atlases
+from sprite_cache import rotation_cache, shrink_frame_cache
+from asset_pack import get_asset_pack
+
+# ======================================================================================
+# 공용 이미지 캐시 (경로별 원본, (경로, 크기)별 변환 이미지를 프로세스 전체에서 공유)
+# ======================================================================================
+ASSET_CACHE_MAX_BYTES = 32 * 1024 * 1024   # 크기를 바꾼 이미지를 이 용량까지 보관합니다.
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+class AssetCache:
+    """이미지를 경로마다 한 번만 디코딩하고, 크기를 바꾼 이미지도 (경로, 크기)별로 공유합니다.
+
+    원본(아틀라스의 subsurface 또는 파일에서 한 번 읽은 Surface)은 내보내지 않고,
+    크기를 바꾼 이미지는 max_bytes를 넘으면 가장 오래 쓰지 않은 것부터 버립니다.
+    돌려준 Surface는 여러 곳에서 함께 쓰므로 호출한 쪽에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_bytes=ASSET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.originals = {}              # (경로, 알파 여부) -> surf
+        self.failures = {}               # (경로, 알파 여부) -> 읽기 실패 예외 (파일을 다시 찾지 않도록)
+        self.pending = {}                # (경로, 알파 여부) -> 디코딩 Future: preload()로 맡긴 이미지
+        self.scaled_entries = OrderedDict()   # (경로, 크기, smooth) -> surf
+        self.scaled_bytes = 0
+        self.loads = self.hits = self.misses = 0
+
+    def image(self, path, alpha=True):
+        """load_sprite(path)와 같은 이미지를 돌려주되 (경로, alpha)마다 한 번만 읽습니다. 실패하면 같은 예외를 다시 냅니다.
+
+        alpha=False면 배경처럼 투명도가 없는 이미지로 보고 아틀라스를 거치지 않고 convert()합니다.
+        같은 경로라도 alpha가 다르면 형식이 다른 Surface이므로 따로 보관합니다.
+        preload()로 맡겨 둔 이미지면 디코딩이 끝나기를 기다렸다가 씁니다.
+        에셋 팩에 있는 이미지는 디코딩 없이 팩의 픽셀을 화면 형식으로 바꾸기만 합니다.
+        """
+        key = (normalize_name(path), alpha)
+        surface = self.originals.get(key)
+        if surface is not None: return surface
+        if key in self.pending: self._finish_preload(key)
+        if key in self.failures: raise self.failures[key]
+        if key in self.originals: return self.originals[key]
+        pack = get_asset_pack()
+        try:
+            if pack is not None and pack.has_image(path):
+                surface = pack.load_image(path)
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            else:
+                surface = load_sprite(path) if alpha else pygame.image.load(resource_path(path)).convert()
+        except (pygame.error, OSError) as e:
+            self.failures[key] = e
+            raise
+        self.loads += 1
+        self.originals[key] = surface
+        return surface
+
+    def preload(self, executor, path, alpha=True):
+        """path 이미지 디코딩을 executor 스레드에 맡기고 Future를 반환합니다 (이미 있거나 에셋 팩에 있으면 None).
+
+        pygame.image.load는 디코딩하는 동안 GIL을 놓으므로 여러 장을 동시에 풀 수 있습니다.
+        화면 형식으로 바꾸는 convert()는 finish_preloads()나 image()에서 메인 스레드가 합니다.
+        """
+        key = (normalize_name(path), alpha)
+        if key in self.originals or key in self.failures: return None
+        pack = get_asset_pack()
+        if pack is not None and pack.has_image(path): return None   # 풀 것이 없으므로 image()가 바로 만듭니다.
+        if key not in self.pending:
+            self.pending[key] = executor.submit(pygame.image.load, resource_path(path))
+        return self.pending[key]
+
+    def finish_preloads(self):
+        """디코딩이 끝난 이미지를 등록하고 아직 남은 개수를 반환합니다. 메인 스레드에서 호출합니다."""
+        for key in [key for key, future in self.pending.items() if future.done()]:
+            self._finish_preload(key)
+        return len(self.pending)
+
+    def _finish_preload(self, key):
+        future = self.pending.pop(key)
+        alpha = key[1]
+        try:
+            image = future.result()
+        except (pygame.error, OSError) as e:
+            self.failures[key] = e
+            return
+        self.loads += 1
+        self.originals[key] = image.convert_alpha() if alpha else image.convert()
+
+    def scaled(self, path, size, smooth=False):
+        """path 이미지를 size로 늘이거나 줄인 공유 Surface. smooth=True면 smoothscale을 씁니다."""
+        size = (int(size[0]), int(size[1]))
+        key = (normalize_name(path), size, smooth)
+        surface = self.scaled_entries.get(key)
+        if surface is not None:
+            self.scaled_entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        original = self.image(path)
+        if original.get_size() == size: return original
+        surface = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(original, size)
+        self.scaled_entries[key] = surface
+        self.scaled_bytes += surface_bytes(surface)
+        while self.scaled_bytes > self.max_bytes and self.scaled_entries:
+            _, evicted = self.scaled_entries.popitem(last=False)
+            self.scaled_bytes -= surface_bytes(evicted)
+        return surface
+
+    def clear_scaled(self):
+        """해상도가 바뀌면 이전 크기의 이미지는 더 쓰지 않으므로 비웁니다. 원본은 남겨 둡니다."""
+        self.scaled_entries.clear()
+        self.scaled_bytes = 0
+
+    def clear(self):
+        self.originals.clear()
+        self.failures.clear()
+        self.clear_scaled()
+
+    def stats(self):
+        # 아틀라스에서 온 원본은 시트를 가리키는 subsurface이므로 별도 메모리를 쓰지 않습니다.
+        file_bytes = sum(surface_bytes(s) for s in self.originals.values() if s.get_parent() is None)
+        return {"originals": len(self.originals), "original_bytes": file_bytes, "scaled": len(self.scaled_entries), "scaled_bytes": self.scaled_bytes,
+                "loads": self.loads, "hits": self.hits, "misses": self.misses}
+
+# 전역 에셋 캐시 인스턴스
+asset_cache = AssetCache()
+
+def memory_report():
+    """이미지 캐시들이 차지하는 메모리(바이트)를 항목별로 반환합니다."""
+    report = {
+        "atlas_sheets": sum(surface_bytes(atlas.image) for atlas in get_atlases()),
+        "asset_originals": asset_cache.stats()["original_bytes"],
+        "asset_scaled": asset_cache.scaled_bytes,
+        "rotations": rotation_cache.used_bytes,
+        "shrink_frames": shrink_frame_cache.stats()["bytes"],
+    }
+    report["total"] = sum(report.values())
+    return report
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# asset_pack.py - 미리 디코딩한 에셋을 한 파일에 묶는 팩 도구와 런타임 리더
+#
+# 배포 빌드는 실행할 때마다 PNG/OGG를 다시 풀어야 합니다. 이 파일을 직접 실행하면
+# 아틀라스 시트와 배경 원본 이미지의 픽셀, 믹서 형식으로 풀어 둔 사운드 PCM과 원본 OGG,
+# 폰트 파일을 한 개의 팩 파일(ASSET_PACK_PATH)에 씁니다. 해상도별 배경은 넣지 않습니다
+# (기준 해상도에서는 잘라 복사할 뿐이고, 다른 해상도는 작업 스레드에서 원본을 스케일링합니다).
+# 게임은 팩이 있으면 mmap으로 열어 필요한 항목의 페이지만 읽고, pygame.image.frombuffer로
+# 압축 해제 없이 Surface를 만듭니다. 팩이 없거나 항목이 없으면 기존처럼 개별 파일을 읽습니다.
+#
+# 파일 구조: 헤더(PACK_HEADER) | 데이터 블록들 (PACK_ALIGN 정렬) | 색인 JSON
+#   색인 항목: 이름 -> {"offset", "length", "kind": image/sound/data, ...}
+#   이름 규칙: atlas:<아틀라스 이름>, image:<경로>, sound:<경로>, data:<경로>
+#   색인의 "sources"는 팩이 대신하는 원본 파일 목록입니다. AnimalBridge.spec은 이 파일들을 빌드에서 뺍니다.
+#
+# 사용 예:
+#   python asset_pack.py                 # animal_bridge.pack 다시 생성 (PyInstaller 빌드 전에 실행)
+#   python asset_pack.py --list          # 팩 항목 목록
+
+import io
+import os
+import sys
+import json
+import mmap
+import glob
+import struct
+import hashlib
+import argparse
+
+import pygame
+from settings import resource_path
+
+ASSET_PACK_PATH = "animal_bridge.pack"
+PACK_MAGIC = b"ABPACK\x00\x00"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<8sIQQ")   # 매직, 버전, 색인 위치, 색인 길이
+PACK_ALIGN = 64                          # 데이터 블록 시작 위치 정렬 (바이트)
+
+def pack_key(path):
+    """게임 폴더 기준 경로를 '/'로 이은 이름으로 바꿉니다. resource_path()로 만든 절대 경로도 받습니다."""
+    if os.path.isabs(path): path = os.path.relpath(path, resource_path("."))
+    return os.path.normpath(path).replace(os.sep, '/')
+
+# ======================================================================================
+# 런타임 리더
+# ======================================================================================
+class AssetPack:
+    """팩 파일을 읽기 전용 mmap으로 열고 항목을 Surface/Sound/바이트로 돌려줍니다.
+
+    image()가 돌려주는 Surface는 mmap의 페이지를 그대로 가리키므로 수정할 수 없고,
+    화면에 그리기 전에 convert()/convert_alpha()로 화면 형식의 복사본을 만들어 씁니다.
+    이런 Surface가 남아 있는 동안은 mmap을 닫을 수 없으므로 팩은 프로세스가 끝날 때까지 열어 둡니다.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_offset, index_length = PACK_HEADER.unpack_from(self.map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"지원하지 않는 에셋 팩입니다: {path} (버전 {version})")
+        self.index = json.loads(self.map[index_offset:index_offset + index_length].decode('utf-8'))
+        self.entries = self.index["entries"]
+        self.view = memoryview(self.map)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def data(self, name):
+        """항목의 바이트를 복사 없이 가리키는 memoryview."""
+        entry = self.entries[name]
+        return self.view[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def image(self, name):
+        entry = self.entries[name]
+        return pygame.image.frombuffer(self.data(name), tuple(entry["size"]), entry["format"])
+
+    def has_image(self, path):
+        return f"image:{pack_key(path)}" in self.entries
+
+    def load_image(self, path):
+        return self.image(f"image:{pack_key(path)}")
+
+    def atlas_names(self):
+        return sorted(name[len("atlas:"):] for name in self.entries if name.startswith("atlas:"))
+
+    def load_atlas(self, atlas_name):
+        """read_atlas()와 같은 (convert 전 시트 이미지, 이름 -> Rect)를 돌려줍니다."""
+        name = f"atlas:{atlas_name}"
+        regions = {sprite: pygame.Rect(rect) for sprite, rect in self.entries[name]["regions"].items()}
+        return self.image(name), regions
+
+    def load_sound(self, path):
+        """미리 풀어 둔 PCM으로 Sound를 만듭니다. 팩에 없으면 None.
+
+        믹서 형식이 팩을 만들 때와 다르면 함께 넣어 둔 원본 OGG를 메모리에서 풀어 씁니다.
+        """
+        entry = self.entries.get(f"sound:{pack_key(path)}")
+        if entry is not None and tuple(entry["mixer"]) == pygame.mixer.get_init():
+            return pygame.mixer.Sound(buffer=self.data(f"sound:{pack_key(path)}"))
+        encoded = self.file_data(path)
+        return pygame.mixer.Sound(file=io.BytesIO(encoded)) if encoded is not None else None
+
+    def file_data(self, path):
+        """팩에 넣어 둔 파일(폰트 등)의 내용. 없으면 None."""
+        name = f"data:{pack_key(path)}"
+        return self.data(name) if name in self.entries else None
+
+    def sources(self):
+        """팩이 대신하는 원본 파일 경로(게임 폴더 기준) 목록."""
+        return list(self.index.get("sources", []))
+
+_asset_pack = None
+_asset_pack_checked = False
+
+def get_asset_pack():
+    """게임 폴더의 에셋 팩을 처음 호출할 때 한 번만 엽니다. 없거나 읽을 수 없으면 None."""
+    global _asset_pack, _asset_pack_checked
+    if not _asset_pack_checked:
+        _asset_pack_checked = True
+        path = resource_path(ASSET_PACK_PATH)
+        if os.path.isfile(path):
+            try:
+                _asset_pack = AssetPack(path)
+                print(f"✓ 에셋 팩 사용: {ASSET_PACK_PATH} (항목 {len(_asset_pack.entries)}개)")
+            except (OSError, ValueError, struct.error) as e:
+                print(f"✗ 에셋 팩 열기 실패, 개별 파일을 읽습니다: {e}")
+    return _asset_pack
+
+# ======================================================================================
+# 오프라인 패커
+# ======================================================================================
+class PackWriter:
+    """데이터 블록을 차례로 쓰고 마지막에 색인을 붙입니다. 내용이 같은 블록은 한 번만 씁니다."""
+
+    def __init__(self, f):
+        self.f = f
+        self.entries = {}
+        self.blocks = {}   # sha1 -> (offset, length)
+        f.write(b"\x00" * PACK_HEADER.size)
+
+    def add(self, name, payload, **meta):
+        digest = hashlib.sha1(payload).digest()
+        if digest not in self.blocks:
+            offset = -self.f.tell() % PACK_ALIGN + self.f.tell()
+            self.f.seek(offset)
+            self.f.write(payload)
+            self.blocks[digest] = (offset, len(payload))
+        offset, length = self.blocks[digest]
+        self.entries[name] = dict(meta, offset=offset, length=length)
+
+    def add_surface(self, name, surface, alpha=True, **meta):
+        pixel_format = "RGBA" if alpha else "RGB"
+        self.add(name, pygame.image.tobytes(surface, pixel_format), kind="image", size=list(surface.get_size()), format=pixel_format, **meta)
+
+    def finish(self, **index):
+        index_bytes = json.dumps(dict(index, entries=self.entries), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        index_offset = self.f.seek(0, os.SEEK_END)
+        self.f.write(index_bytes)
+        self.f.seek(0)
+        self.f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, index_offset, len(index_bytes)))
+
+def build_pack(output_path=ASSET_PACK_PATH):
+    # 게임 모듈은 팩을 만들 때만 필요하므로 여기서 가져옵니다 (런타임 리더는 settings만 씁니다).
+    from texture_atlas import atlas_xml_paths, read_atlas
+    from render_manager import BACKGROUND_PATH, OPENING_BACKGROUNDS
+    from audio_manager import audio_manager
+
+    temp_path = output_path + ".tmp"
+    sources = set()
+    with open(temp_path, 'wb') as f:
+        writer = PackWriter(f)
+
+        # 아틀라스에 든 스프라이트는 load_sprite()가 아틀라스에서만 꺼내므로 원본 이미지도 팩이 대신합니다.
+        for xml_path in atlas_xml_paths():
+            image, regions = read_atlas(xml_path)
+            atlas_name = os.path.splitext(os.path.basename(xml_path))[0]
+            writer.add_surface(f"atlas:{atlas_name}", image, regions={name: list(rect) for name, rect in regions.items()})
+            sources.update([pack_key(xml_path), pack_key(os.path.splitext(xml_path)[0] + ".png")], regions)
+            print(f"✓ 아틀라스 {atlas_name}: 스프라이트 {len(regions)}개")
+
+        # 배경은 투명도 없이 convert()해서 쓰므로 원본을 RGB로 저장합니다.
+        for path in [BACKGROUND_PATH] + OPENING_BACKGROUNDS:
+            writer.add_surface(f"image:{pack_key(path)}", pygame.image.load(path), alpha=False)
+            sources.add(pack_key(path))
+        print(f"✓ 배경 원본 {1 + len(OPENING_BACKGROUNDS)}개")
+
+        # 사운드는 게임과 같은 기본 설정으로 믹서를 열어 그 형식의 PCM으로 풀어 두고,
+        # 실행할 때 믹서 형식이 다를 때를 위해 원본 OGG도 함께 넣습니다.
+        mixer_format = pygame.mixer.get_init() if audio_manager.init_mixer() else None
+        if mixer_format is None: print("✗ 믹서를 열 수 없어 사운드는 원본 OGG만 넣습니다.")
+        packed_sounds = 0
+        for path in audio_manager.sound_paths.values():
+            if not os.path.exists(path):
+                print(f"✗ 사운드 파일을 찾을 수 없어 건너뜁니다: {pack_key(path)}")
+                continue
+            if mixer_format: writer.add(f"sound:{pack_key(path)}", pygame.mixer.Sound(path).get_raw(), kind="sound", mixer=list(mixer_format))
+            with open(path, 'rb') as sound_file: writer.add(f"data:{pack_key(path)}", sound_file.read(), kind="data")
+            sources.add(pack_key(path))
+            packed_sounds += 1
+        print(f"✓ 사운드 {packed_sounds}개 (믹서 {mixer_format})")
+
+        for path in sorted(glob.glob(os.path.join('assets', 'Font', '*.ttf'))):
+            with open(path, 'rb') as font_file: writer.add(f"data:{pack_key(path)}", font_file.read(), kind="data")
+            sources.add(pack_key(path))
+
+        writer.finish(version=PACK_VERSION, sources=sorted(sources))
+    os.replace(temp_path, output_path)
+    print(f"✓ 에셋 팩 생성: {output_path} ({os.path.getsize(output_path) / (1024 * 1024):.1f} MB, 항목 {len(writer.entries)}개)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Animal Bridge 에셋 팩 생성기")
+    parser.add_argument("--out", default=ASSET_PACK_PATH, help="팩 파일 경로")
+    parser.add_argument("--list", action="store_true", help="새로 만들지 않고 팩 항목을 출력합니다")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        pack = AssetPack(args.out)
+        for name, entry in sorted(pack.entries.items()):
+            print(f"{entry['length']:>10}  {name}")
+        return 0
+
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")   # 사운드를 풀 때 소리를 낼 장치는 필요 없습니다.
+    pygame.init()
+    build_pack(args.out)
+    pygame.quit()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
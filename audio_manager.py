@@ -4,20 +4,22 @@ import pygame
 import os
 import sys
 from settings import resource_path
+from asset_pack import get_asset_pack
 
 class AudioManager:
-    def __init__(self, sound_volume: float = 1.0, music_volume: float = 1.0):
-        try:
-            pygame.mixer.init()
-            freq, size, channels = pygame.mixer.get_init()
-            print(f"✓ Pygame Mixer 초기화 성공! (주파수: {freq}, 채널: {channels})")
-        except pygame.error as e:
-            print(f"✗ Pygame Mixer 초기화 실패: {e}")
+    """사운드와 배경음악을 관리합니다.
+
+    import할 때는 아무 파일도 읽지 않습니다. 사운드는 preload_sounds()로 작업 스레드에서 미리 읽거나,
+    그 전에 재생을 요청하면 그 자리에서 하나만 읽습니다. 에셋 팩에 풀어 둔 PCM이 있으면 파일 대신 그것을 씁니다.
+    """
 
+    def __init__(self, sound_volume: float = 1.0, music_volume: float = 1.0):
         self.sound_volume = sound_volume
         self.music_volume = music_volume
         
         self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self.pending_sounds = {}    # 이름 -> 작업 스레드에서 읽고 있는 Sound의 Future
+        self.missing_sounds = set()
         
         self.sound_paths = {
             'click': resource_path('assets/Sound/select_002.ogg'),
@@ -32,30 +34,73 @@ class AudioManager:
             'destroy': resource_path('assets/Sound/destroy.ogg'),
             'victory': resource_path('assets/Sound/yay.ogg')
         }
-        
-        self.load_sounds()
-    
-    def load_sounds(self):
-        """사운드 파일들을 로드"""
-        print("\n--- 사운드 로딩 시작 ---")
+
+    def init_mixer(self) -> bool:
+        """믹서를 처음 쓸 때 한 번 초기화합니다."""
+        if pygame.mixer.get_init(): return True
+        try:
+            pygame.mixer.init()
+            freq, size, channels = pygame.mixer.get_init()
+            print(f"✓ Pygame Mixer 초기화 성공! (주파수: {freq}, 채널: {channels})")
+            return True
+        except pygame.error as e:
+            print(f"✗ Pygame Mixer 초기화 실패: {e}")
+            return False
+
+    def preload_sounds(self, executor):
+        """아직 읽지 않은 사운드를 executor 스레드에서 읽게 하고 Future 목록을 반환합니다."""
+        if not self.init_mixer(): return []
         for name, path in self.sound_paths.items():
-            print(f"'{name}' 로딩 시도 -> 경로: {path}")
-            try:
-                if os.path.exists(path):
-                    sound = pygame.mixer.Sound(path)
-                    sound.set_volume(self.sound_volume)
-                    self.sounds[name] = sound
-                    print("  -> ✓ 성공!")
-                else:
-                    print(f"  -> ✗ 실패: 파일을 찾을 수 없습니다: {path}")
-            except pygame.error as e:
-                print(f"  -> ✗ 실패: Pygame 오류 - {e}")
-        print("--- 사운드 로딩 완료 ---\n")
+            if name in self.sounds or name in self.pending_sounds or name in self.missing_sounds: continue
+            if self._load_packed_sound(name): continue   # 풀 것이 없으므로 작업 스레드에 맡기지 않습니다.
+            if not os.path.exists(path):
+                print(f"✗ 사운드 파일을 찾을 수 없습니다: {path}")
+                self.missing_sounds.add(name)
+                continue
+            self.pending_sounds[name] = executor.submit(pygame.mixer.Sound, path)
+        return list(self.pending_sounds.values())
+
+    def load_sounds(self):
+        """남은 사운드 파일들을 지금 모두 로드"""
+        for name in self.sound_paths: self._get_sound(name)
+
+    def _load_packed_sound(self, name):
+        """에셋 팩의 사운드를 등록합니다 (믹서 형식이 같으면 PCM, 다르면 원본 OGG). 팩에 없으면 None."""
+        pack = get_asset_pack()
+        sound = pack.load_sound(self.sound_paths[name]) if pack is not None and name in self.sound_paths else None
+        if sound is not None:
+            sound.set_volume(self.sound_volume)
+            self.sounds[name] = sound
+        return sound
+
+    def _get_sound(self, name):
+        sound = self.sounds.get(name)
+        if sound is not None or name in self.missing_sounds: return sound
+        if name not in self.pending_sounds and self.init_mixer():
+            sound = self._load_packed_sound(name)
+            if sound is not None: return sound
+        future = self.pending_sounds.pop(name, None)
+        try:
+            if future is not None: sound = future.result()
+            elif name in self.sound_paths and self.init_mixer():
+                path = self.sound_paths[name]
+                if os.path.exists(path): sound = pygame.mixer.Sound(path)
+                else: print(f"✗ 사운드 파일을 찾을 수 없습니다: {path}")
+        except pygame.error as e:
+            print(f"✗ 사운드 로드 실패 ({name}): {e}")
+        if sound is None:
+            self.missing_sounds.add(name)
+            return None
+        sound.set_volume(self.sound_volume)
+        self.sounds[name] = sound
+        return sound
     
     def play_sound(self, sound_name: str):
-        """사운드 재생"""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        """사운드 재생 (아직 읽지 않았으면 먼저 읽음). 없는 사운드는 처음 한 번만 알리고 이후에는 조용히 넘어갑니다."""
+        if sound_name in self.missing_sounds: return
+        sound = self._get_sound(sound_name)
+        if sound is not None:
+            sound.play()
         else:
             print(f"사운드를 찾을 수 없습니다: {sound_name}")
     
@@ -130,6 +175,8 @@ class AudioManager:
     
     def remove_sound(self, name: str):
         """사운드 제거"""
+        self.sound_paths.pop(name, None)
+        self.pending_sounds.pop(name, None)
         if name in self.sounds:
             del self.sounds[name]
     
@@ -143,6 +190,7 @@ class AudioManager:
     
     def get_available_sounds(self) -> list:
         """사용 가능한 사운드 목록 반환"""
+        self.load_sounds()
         return list(self.sounds.keys())
 
 # 전역 오디오 매니저 인스턴스
@@ -0,0 +1,96 @@
+# compiled_stage.py
+
+import pygame
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import settings
+from settings import *
+from game_objects import flag_geometry
+
+# ======================================================================================
+# 컴파일된 스테이지 (STAGE_DATA를 현재 해상도 좌표로 미리 계산한 읽기 전용 정보)
+# ======================================================================================
+@dataclass(frozen=True)
+class CompiledStage:
+    """한 스테이지에서 바뀌지 않는 좌표/영역을 해상도에 맞춰 한 번만 계산해 둔 값입니다.
+
+    시뮬레이션, 렌더링, 입력 처리가 같은 객체를 공유하므로 안에 든 Rect는 읽기만 해야 합니다.
+    get_compiled_stage()로 얻고, 해상도가 바뀌면 clear_compiled_stages()로 버립니다.
+    """
+    stage_level: int
+    resolution: Tuple[int, int]
+    available_animals: Tuple[str, ...]
+    terrain_rects: Tuple[pygame.Rect, ...]
+    static_body_specs: tuple          # (중심, 크기, 카테고리, 마스크) - 지형과 화면 테두리 벽
+    has_hazard_floor: bool
+    hazard_y: Optional[float]
+    goal_pos: Tuple[int, int]         # 깃발 기준 위치 (기준 해상도 좌표)
+    flag_pole_rect: pygame.Rect       # 깃발 모양 (flag_geometry 결과)
+    flag_cloth_points: tuple
+    goal_rect: pygame.Rect            # 플레이어 중심이 들어가면 클리어
+    player_spawn: Tuple[int, int]
+    block_scale: float
+    gravity: Tuple[int, int]
+    move_speed: int
+    drop_zone: pygame.Rect
+    restart_button_rect: pygame.Rect
+    help_button_rect: pygame.Rect
+
+def compile_stage(stage_level):
+    stage_data = STAGE_DATA.get(str(stage_level), STAGE_DATA["1"])
+    width, height = settings.WIDTH, settings.HEIGHT
+    terrain_specs = tuple(tuple(spec) for spec in stage_data["terrain"])
+
+    terrain_rects, static_body_specs = [], []
+    terrain_mask = PLAYER_CATEGORY | ANIMAL_CATEGORY
+    for pos_x, pos_y, size_w, size_h in terrain_specs:
+        center, size = (scale_x(pos_x), scale_y(pos_y)), (scale_x(size_w), scale_y(size_h))
+        terrain_rects.append(pygame.Rect(center[0] - size[0] // 2, center[1] - size[1] // 2, size[0], size[1]))
+        static_body_specs.append((center, size, TERRAIN_CATEGORY, terrain_mask))
+    # 천장, 좌우 벽, 바닥
+    static_body_specs += [
+        ((width / 2, scale_y(-10)), (width, scale_y(20)), CEILING_CATEGORY, PLAYER_CATEGORY),
+        ((scale_x(-10), height / 2), (scale_x(20), height), TERRAIN_CATEGORY, terrain_mask),
+        ((width + scale_x(10), height / 2), (scale_x(20), height), TERRAIN_CATEGORY, terrain_mask),
+        ((width / 2, height + scale_y(10)), (width, scale_y(20)), TERRAIN_CATEGORY, terrain_mask),
+    ]
+
+    has_hazard_floor = stage_data.get("has_hazard_floor", False)
+    goal_pos = tuple(stage_data.get("goal_pos", (1200, 300)))
+    pole_rect, cloth_points = flag_geometry(goal_pos)
+    drop_zone_w = scale_x(680)
+    restart_button_rect = pygame.Rect(scale_x(20), scale_y(20), scale_x(150), scale_y(50))
+
+    return CompiledStage(
+        stage_level=stage_level,
+        resolution=(width, height),
+        available_animals=tuple(stage_data["available_animals"]),
+        terrain_rects=tuple(terrain_rects),
+        static_body_specs=tuple(static_body_specs),
+        has_hazard_floor=has_hazard_floor,
+        hazard_y=height - scale_y(20) if has_hazard_floor else None,
+        goal_pos=goal_pos,
+        flag_pole_rect=pole_rect,
+        flag_cloth_points=cloth_points,
+        goal_rect=pygame.Rect(pole_rect.right - scale_x(10), pole_rect.top, scale_x(40), scale_y(60)),
+        player_spawn=(scale_x(80), scale_y(280)),
+        block_scale=width / (BASE_WIDTH / 56.25),
+        gravity=(0, scale_y(981)),
+        move_speed=scale_x(250),
+        drop_zone=pygame.Rect((width / 2) - (drop_zone_w / 2), scale_y(30), drop_zone_w, scale_y(130)),
+        restart_button_rect=restart_button_rect,
+        help_button_rect=pygame.Rect(restart_button_rect.right + scale_x(10), scale_y(20), scale_y(50), scale_y(50)),
+    )
+
+_compiled_stages = {}
+
+def get_compiled_stage(stage_level):
+    key = (stage_level, settings.WIDTH, settings.HEIGHT)
+    compiled = _compiled_stages.get(key)
+    if compiled is None:
+        compiled = _compiled_stages[key] = compile_stage(stage_level)
+    return compiled
+
+def clear_compiled_stages():
+    """해상도가 바뀌어 좌표 기준이 달라지면 컴파일된 스테이지를 모두 버립니다."""
+    _compiled_stages.clear()
@@ -0,0 +1,158 @@
+# frame_profiler.py - 프레임 단계별 시간 측정기
+#
+# 게임 루프가 단계 경계마다 profiler.mark("단계")를 부르면 직전 경계부터의 시간을 그 단계에 더합니다.
+# 프레임마다 단계별 시간을 최근 PROFILE_WINDOW 프레임만큼 모아 p50/p95/p99를 구하고,
+# 게임 플레이 화면에서는 F3으로 오버레이를 켜고 끌 수 있습니다. CSV 경로를 주면 프레임마다 한 줄씩 기록합니다.
+# 측정이 꺼져 있으면 begin_frame()/mark()/end_frame()은 바로 반환하므로 비용이 거의 없습니다.
+#
+# 사용 예:
+#   ANIMAL_BRIDGE_PROFILE=profile.csv python run_game.py   # 시작부터 측정하고 CSV로 기록
+#   게임 플레이 중 F3                                        # 오버레이 토글 (측정이 꺼져 있었다면 켬)
+
+import os
+import csv
+import atexit
+import math
+import time
+from collections import deque
+
+import pygame
+from settings import *
+from asset_cache import memory_report
+
+PROFILE_PHASES = ("events", "checks", "physics", "world", "entities", "ui", "flip")
+PROFILE_WINDOW = 240            # 백분위수를 계산할 최근 프레임 수
+PROFILE_HUD_REFRESH = 15        # 오버레이 숫자를 이 프레임마다 다시 계산합니다.
+PROFILE_ENV_VAR = "ANIMAL_BRIDGE_PROFILE"
+PROFILE_TOGGLE_KEY = pygame.K_F3
+
+def percentile(sorted_values, p):
+    """정렬된 목록의 p 백분위수 (nearest-rank)."""
+    if not sorted_values: return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+class FrameProfiler:
+    """프레임을 단계별로 나눠 시간을 재고, 최근 프레임의 백분위수와 CSV 기록을 제공합니다.
+
+    한 프레임은 begin_frame(화면 이름) → mark(단계)... → end_frame() 순서로 기록합니다.
+    mark()는 직전 mark(또는 begin_frame)부터 지금까지의 시간을 그 단계에 더하므로,
+    물리 스텝처럼 한 프레임에 여러 번 도는 단계는 자동으로 합산됩니다.
+    """
+
+    def __init__(self, window=PROFILE_WINDOW):
+        self.enabled = False
+        self.show_overlay = False
+        self.in_frame = False
+        self.screen_name = None
+        self.frame_index = 0
+        self.samples = {phase: deque(maxlen=window) for phase in PROFILE_PHASES + ("frame",)}
+        self.current = dict.fromkeys(PROFILE_PHASES, 0.0)
+        self.last_mark = 0.0
+        self.csv_file = None
+        self.csv_writer = None
+        self.hud_font = None
+        self.hud_surfaces = []
+        self.hud_age = PROFILE_HUD_REFRESH
+
+    def enable(self, csv_path=None):
+        """측정을 켭니다. csv_path를 주면 프레임마다 단계별 시간(ms)을 그 파일에 씁니다."""
+        self.enabled = True
+        if csv_path and self.csv_file is None:
+            try:
+                self.csv_file = open(csv_path, 'w', newline='', encoding='utf-8')
+            except OSError as e:
+                print(f"✗ 프로파일 CSV 열기 실패: {e}")
+                return
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(["frame", "screen"] + [f"{phase}_ms" for phase in PROFILE_PHASES] + ["frame_ms"])
+            print(f"✓ 프레임 프로파일 기록: {csv_path}")
+
+    def disable(self):
+        self.enabled = self.show_overlay = self.in_frame = False
+        self.close()
+
+    def close(self):
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = self.csv_writer = None
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay and not self.enabled: self.enable()
+        # 해상도가 바뀌었을 수 있으므로 글꼴과 숫자를 다시 만듭니다.
+        self.hud_font, self.hud_age = None, PROFILE_HUD_REFRESH
+
+    # ----------------------------------------------------------------------------------
+    # 프레임 기록
+    # ----------------------------------------------------------------------------------
+    def begin_frame(self, screen_name):
+        if not self.enabled: return
+        self.in_frame = True
+        self.screen_name = screen_name
+        for phase in self.current: self.current[phase] = 0.0
+        self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """직전 경계부터 지금까지의 시간을 phase에 더합니다."""
+        if not self.in_frame: return
+        now = time.perf_counter()
+        self.current[phase] += now - self.last_mark
+        self.last_mark = now
+
+    def skip(self):
+        """직전 경계부터 지금까지의 시간을 어느 단계에도 넣지 않습니다 (오버레이 그리기 등)."""
+        if self.in_frame: self.last_mark = time.perf_counter()
+
+    def end_frame(self):
+        if not self.in_frame: return
+        self.in_frame = False
+        self.frame_index += 1
+        total = 0.0
+        for phase, seconds in self.current.items():
+            self.samples[phase].append(seconds)
+            total += seconds
+        self.samples["frame"].append(total)
+        if self.csv_writer is not None:
+            self.csv_writer.writerow([self.frame_index, self.screen_name] + [f"{self.current[phase] * 1000:.3f}" for phase in PROFILE_PHASES] + [f"{total * 1000:.3f}"])
+
+    def percentiles(self, phase):
+        """phase의 최근 프레임 (p50, p95, p99)를 ms 단위로 반환합니다."""
+        values = sorted(self.samples[phase])
+        return tuple(percentile(values, p) * 1000 for p in (50, 95, 99))
+
+    def summary(self):
+        return {phase: self.percentiles(phase) for phase in self.samples}
+
+    # ----------------------------------------------------------------------------------
+    # 오버레이
+    # ----------------------------------------------------------------------------------
+    def draw_overlay(self, screen, ui_manager):
+        """오버레이가 켜져 있으면 화면 오른쪽 위에 단계별 p50/p95/p99, 이미지 캐시 메모리와 폰트 로드 시간을 그립니다. 그리는 시간은 측정에서 뺍니다."""
+        if not (self.show_overlay and self.in_frame): return
+        self.hud_age += 1
+        if self.hud_age >= PROFILE_HUD_REFRESH:
+            # 숫자는 몇 프레임마다만 바뀌므로 글자 캐시를 거치지 않고 직접 렌더링해 들고 있습니다.
+            if self.hud_font is None: self.hud_font = font_registry.sysfont("consolas,dejavusansmono,monospace", scale_font(15))
+            lines = [f"{'ms':<10}{'p50':>7}{'p95':>7}{'p99':>7}"]
+            for phase in PROFILE_PHASES + ("frame",):
+                p50, p95, p99 = self.percentiles(phase)
+                lines.append(f"{phase:<10}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+            lines.append(f"{'images':<10}{memory_report()['total'] / (1024 * 1024):>11.1f} MB")
+            font_stats = font_registry.stats()
+            lines.append(f"{'fonts':<10}{font_stats['fonts']:>4}{font_stats['load_ms']:>7.1f} ms")
+            self.hud_surfaces = [self.hud_font.render(line, True, WHITE) for line in lines]
+            self.hud_age = 0
+
+        line_height = self.hud_font.get_linesize()
+        panel_rect = pygame.Rect(0, 0, max(s.get_width() for s in self.hud_surfaces) + scale_x(16), line_height * len(self.hud_surfaces) + scale_y(12))
+        panel_rect.topright = (screen.get_width() - scale_x(10), scale_y(80))   # 타이머 아래
+        screen.blit(ui_manager.overlay_pool.get(panel_rect.size, (0, 0, 0, 170)), panel_rect)
+        for i, surface in enumerate(self.hud_surfaces):
+            screen.blit(surface, (panel_rect.x + scale_x(8), panel_rect.y + scale_y(6) + i * line_height))
+        self.skip()
+
+# 전역 프로파일러 인스턴스 (환경 변수로 CSV 경로를 주면 시작부터 측정합니다)
+profiler = FrameProfiler()
+if os.environ.get(PROFILE_ENV_VAR): profiler.enable(os.environ[PROFILE_ENV_VAR])
+atexit.register(profiler.close)
@@ -0,0 +1,439 @@
+# game_objects.py
+
+import pygame
+import pymunk
+import math
+import os
+from settings import *
+from settings import resource_path
+from sprite_cache import rotation_cache, shrink_frame_cache
+from asset_cache import asset_cache
+
+# ======================================================================================
+# 게임 오브젝트 클래스들
+# ======================================================================================
+class Player:
+    def __init__(self, space, pos):
+        self.start_pos = pos
+        self.custom_gravity_force = scale_y(18000)
+        self._create_body(space, self.start_pos)
+
+        # 접지 판정: 발판 접촉 수를 begin/separate에서 세어 두고 매 스텝에는 읽기만 합니다.
+        # 옆면으로 닿은 접촉이 있을 때만 update()에서 그 법선을 다시 읽습니다 (모서리에서 윗면으로 올라서는 경우).
+        self.contact_supports = {}  # 닿아 있는 도형 -> 발판으로 세었는지
+        self.ground_contacts = 0
+        self.is_grounded = False
+        self.steps_since_grounded = COYOTE_STEPS + 1
+        self.jump_buffer_steps = 0
+        add_collision_callbacks(space, PLAYER_COLLISION_TYPE, begin=self._on_contact_begin, separate=self._on_contact_separate)
+        store_previous_transform(self)
+
+    def _create_body(self, space, pos):
+        self.body = pymunk.Body(10, float('inf'), body_type=pymunk.Body.DYNAMIC)
+        self.body.position = pos
+        self.shape = pymunk.Circle(self.body, scale_x(20))
+        self.shape.elasticity = 0.1
+        self.shape.friction = 0.7
+        self.shape.color = RED
+        player_mask = TERRAIN_CATEGORY | CEILING_CATEGORY | ANIMAL_CATEGORY
+        self.shape.filter = pymunk.ShapeFilter(categories=PLAYER_CATEGORY, mask=player_mask)
+        self.shape.collision_type = PLAYER_COLLISION_TYPE
+        space.add(self.body, self.shape)
+
+    def _on_contact_begin(self, arbiter, space, data):
+        other = arbiter.shapes[1]
+        if other.sensor: return  # 가시 센서 등은 발판이 아님
+        supports = abs(arbiter.normal.y) > 0.7
+        self.contact_supports[other] = supports
+        if supports: self.ground_contacts += 1
+
+    def _on_contact_separate(self, arbiter, space, data):
+        if self.contact_supports.pop(arbiter.shapes[1], False): self.ground_contacts -= 1
+
+    def _recheck_side_contact(self, arbiter):
+        """옆면으로 세어 둔 접촉의 법선이 이제 발판 쪽이면 발판으로 셉니다."""
+        other = arbiter.shapes[1]
+        if self.contact_supports.get(other) is False and abs(arbiter.normal.y) > 0.7:
+            self.contact_supports[other] = True
+            self.ground_contacts += 1
+
+    def update(self, space, dt):
+        # 예전에는 60Hz x 5 서브스텝 중 첫 서브스텝에만 힘이 적용되었습니다(초당 F/5의 충격량).
+        # 물리 빈도와 관계없이 같은 중력이 되도록 dt에 비례한 충격량으로 줍니다.
+        self.body.apply_impulse_at_local_point((0, self.custom_gravity_force / 5 * dt))
+        if len(self.contact_supports) > self.ground_contacts: self.body.each_arbiter(self._recheck_side_contact)
+        self.is_grounded = self.ground_contacts > 0
+        self.steps_since_grounded = 0 if self.is_grounded else self.steps_since_grounded + 1
+
+    def set_horizontal_velocity(self, new_vx):
+        self.body.velocity = (new_vx, self.body.velocity.y)
+
+    def buffer_jump(self):
+        """점프 입력을 JUMP_BUFFER_STEPS 스텝 동안 기억해 둡니다."""
+        self.jump_buffer_steps = JUMP_BUFFER_STEPS
+
+    def jump(self):
+        """기억된 점프 입력이 있고 발판 위(또는 코요테 시간 안)이면 점프합니다. 점프했는지 여부를 반환합니다."""
+        if self.jump_buffer_steps <= 0: return False
+        self.jump_buffer_steps -= 1
+        if self.steps_since_grounded > COYOTE_STEPS: return False
+        jump_impulse = scale_y(-4000)
+        self.body.velocity = (self.body.velocity.x, 0)
+        self.body.apply_impulse_at_local_point((0, jump_impulse))
+        self.jump_buffer_steps = 0
+        self.steps_since_grounded = COYOTE_STEPS + 1  # 같은 접지로 두 번 점프하지 않도록
+        return True
+
+    def snapshot_state(self):
+        return {"body": capture_body_state(self.body), "steps_since_grounded": self.steps_since_grounded, "jump_buffer_steps": self.jump_buffer_steps}
+
+    def restore_state(self, space, state):
+        """스냅샷 상태로 되돌립니다. 바디와 도형을 새로 만들어 이전 접촉 정보를 모두 버립니다.
+
+        같은 바디를 뺐다가 다시 넣으면 Chipmunk가 바디에 남겨 둔 위치 보정 속도(v_bias)가
+        그대로 남아, 처음 만든 시뮬레이션과 다음 스텝 결과가 달라집니다.
+        """
+        space.remove(self.body, self.shape)
+        self._create_body(space, self.start_pos)
+        restore_body_state(self.body, state["body"])
+        self.contact_supports.clear()
+        self.ground_contacts = 0
+        self.is_grounded = False
+        self.steps_since_grounded = state["steps_since_grounded"]
+        self.jump_buffer_steps = state["jump_buffer_steps"]
+        store_previous_transform(self)
+
+    def respawn(self):
+        self.body.position = self.start_pos
+        self.body.velocity = (0, 0)
+        self.body.angular_velocity = 0
+        self.body.angle = 0
+        self.steps_since_grounded = COYOTE_STEPS + 1
+        self.jump_buffer_steps = 0
+        store_previous_transform(self)  # 순간이동이므로 보간하지 않음
+
+    def draw(self, screen, alpha=1.0):
+        position, _ = interpolated_transform(self, alpha)
+        pos = (int(position.x), int(position.y))
+        radius = scale_x(20)
+        shadow_pos = (pos[0] + scale_x(3), pos[1] + scale_y(3))
+        pygame.draw.circle(screen, (80, 0, 0), shadow_pos, radius)
+        pygame.draw.circle(screen, (255, 50, 50), pos, radius)
+        pygame.draw.circle(screen, (200, 0, 0), pos, radius, int(scale_x(4)))
+        eye_offset, eye_radius = scale_x(7), scale_x(4)
+        left_eye, right_eye = (pos[0] - eye_offset, pos[1] - scale_y(6)), (pos[0] + eye_offset, pos[1] - scale_y(6))
+        pygame.draw.circle(screen, WHITE, left_eye, eye_radius)
+        pygame.draw.circle(screen, WHITE, right_eye, eye_radius)
+        pygame.draw.circle(screen, BLACK, left_eye, max(1, eye_radius - scale_x(2)))
+        pygame.draw.circle(screen, BLACK, right_eye, max(1, eye_radius - scale_x(2)))
+        mouth_center, mouth_radius = (pos[0], pos[1] + scale_y(8)), scale_x(8)
+        pygame.draw.arc(screen, BLACK, (mouth_center[0] - mouth_radius//2, mouth_center[1] - mouth_radius//2, mouth_radius, mouth_radius), 0, 3.14159, int(scale_x(2)))
+
+class AnimalBlock:
+    def __init__(self, space, pos, animal_name, block_scale, angle_degrees=0, is_ui_element=False, load_image=True):
+        self.name, self.is_ui_element = animal_name, is_ui_element
+        self.template = get_animal_template(animal_name, block_scale)
+        self.block_shape_str = self.template.rows
+        self.head_part_offsets = self.template.head_offsets
+        self.image = None
+        self.shapes, self.head_sensors = [], []
+        self.is_dying = False
+        self.death_elapsed = 0
+        self.death_duration = 300
+        self.last_impact_time = float('-inf')
+
+        hash_value = hash(animal_name)
+        r, g, b = (hash_value & 0xFF0000) >> 16, (hash_value & 0x00FF00) >> 8, hash_value & 0x0000FF
+        self.icon_color, self.body_color, self.face_color, self.eye_color = (r, g, b), (65, 105, 225, 255), (255, 165, 0, 255), BLACK
+        self.image_path = os.path.join('assets', 'img', f'{self.name}.png')
+        self.original_image = None
+        if load_image:
+            try:
+                self.original_image = asset_cache.image(self.image_path)
+                self.image = self.original_image
+            except Exception as e:
+                print(f"'{self.name}' 이미지 로드 실패: {e}")
+                self.image = self.original_image = None
+
+        if is_ui_element:
+            self.rect = pygame.Rect(pos[0], pos[1], 0, 0)
+            return
+
+        template = self.template
+        if not template.pieces:
+            self.body, self.body.position = pymunk.Body(body_type=pymunk.Body.DYNAMIC), pos
+            return
+
+        if self.image:
+            self.image = asset_cache.scaled(self.image_path, template.image_size)
+            # 먹히거나 가시에 닿는 순간 프레임이 튀지 않도록 죽는 애니메이션 프레임을 미리 만들어 둡니다.
+            shrink_frame_cache.frames_for(self.name, self.image)
+        self._create_body(pos, math.radians(angle_degrees))
+        store_previous_transform(self)
+        self.add_to_space(space)
+
+    def _create_body(self, pos, angle):
+        # 질량과 관성은 템플릿에서 미리 계산해 두었으므로 도형에는 질량을 주지 않습니다.
+        template = self.template
+        self.body = pymunk.Body(template.mass, template.moment, body_type=pymunk.Body.DYNAMIC)
+        self.body.center_of_gravity = template.center_of_gravity
+        self.body.position = pos
+        self.body.angle = angle
+
+        self.shapes, self.head_sensors = [], []
+        for verts in template.pieces:
+            rect_shape = pymunk.Poly(self.body, verts)
+            rect_shape.elasticity, rect_shape.friction = 0.2, 1.0
+            rect_shape.filter = template.shape_filter
+            rect_shape.collision_type = ANIMAL_COLLISION_TYPE
+            if self.image: rect_shape.color = (0, 0, 0, 0)
+            else: rect_shape.color = self.body_color
+            self.shapes.append(rect_shape)
+
+        # 머리 칸마다 센서를 달아, 다른 동물과 닿을 때 충돌 핸들러가 포식을 처리하게 합니다.
+        # 반경은 기존 판정(머리 칸 중심과 먹이 사이 거리 < 40)과 같습니다.
+        for offset in self.head_part_offsets:
+            sensor = pymunk.Circle(self.body, template.head_sensor_radius, offset)
+            sensor.sensor = True
+            sensor.collision_type = CARNIVORE_HEAD_COLLISION_TYPE
+            sensor.filter = template.head_sensor_filter
+            self.head_sensors.append(sensor)
+
+    def rebuild_body(self, space, body_state):
+        """스냅샷 상태로 되돌릴 때 바디와 도형을 새로 만듭니다 (공간에는 넣지 않음).
+
+        같은 바디를 다시 쓰면 Chipmunk가 바디에 남겨 둔 위치 보정 속도가 남아 결과가 달라집니다.
+        """
+        self.remove_from_space(space)
+        self._create_body(body_state[0], body_state[2])
+        restore_body_state(self.body, body_state)
+
+    def add_to_space(self, space):
+        if self.body.space is None:
+            space.add(self.body, *self.shapes, *self.head_sensors)
+
+    def remove_from_space(self, space):
+        if self.body.space is space:
+            space.remove(self.body, *self.shapes, *self.head_sensors)
+
+    def draw(self, screen, alpha=1.0):
+        position, angle = interpolated_transform(self, alpha)
+        if self.is_dying:
+            if self.death_elapsed < self.death_duration and self.image:
+                shrunk_image = shrink_frame_cache.frame(self.name, self.image, self.death_elapsed, self.death_duration)
+                if shrunk_image is not None:
+                    rotated_image = rotation_cache.rotated(self.name, shrunk_image, math.degrees(angle) * -1, precompute_axes=False)
+                    rect = rotated_image.get_rect(center=position)
+                    screen.blit(rotated_image, rect.topleft)
+            return
+
+        if self.image:
+            rotated_image = rotation_cache.rotated(self.name, self.image, math.degrees(angle) * -1)
+            rect = rotated_image.get_rect(center=position)
+            screen.blit(rotated_image, rect.topleft)
+        else: self.draw_details(screen)
+
+    def draw_details(self, screen):
+        if self.is_ui_element or self.name not in CARNIVORES or not self.head_part_offsets: return
+        head_world_pos = self.body.local_to_world(self.head_part_offsets[0])
+        eye_radius = scale_x(4)
+        left_eye_pos, right_eye_pos = (head_world_pos.x - scale_x(8), head_world_pos.y - scale_y(5)), (head_world_pos.x + scale_x(8), head_world_pos.y - scale_y(5))
+        pygame.draw.circle(screen, self.eye_color, left_eye_pos, eye_radius)
+        pygame.draw.circle(screen, self.eye_color, right_eye_pos, eye_radius)
+
+    def start_dying(self):
+        if not self.is_dying:
+            self.is_dying = True
+            self.death_elapsed = 0
+
+class Flag:
+    def __init__(self, pos, pole_rect=None, cloth_points=None):
+        """pole_rect/cloth_points로 flag_geometry(pos)를 미리 계산해 둔 값(컴파일된 스테이지)을 주면 다시 계산하지 않습니다."""
+        self.base_pos = pos
+        self.pole_rect = pygame.Rect(0,0,0,0)
+        self.cloth_points = []
+        self.pole_color, self.cloth_color = (192, 192, 192), (220, 20, 60)
+        if pole_rect is None or cloth_points is None: self.update_pos()
+        else: self.pole_rect, self.cloth_points = pole_rect, cloth_points
+
+    def update_pos(self):
+        self.pole_rect, self.cloth_points = flag_geometry(self.base_pos)
+
+    def draw(self, screen):
+        pygame.draw.rect(screen, self.pole_color, self.pole_rect)
+        pygame.draw.polygon(screen, self.cloth_color, self.cloth_points)
+
+def flag_geometry(base_pos):
+    """깃발 기준 위치(기준 해상도 좌표)로부터 깃대 Rect와 깃발 삼각형 꼭짓점을 계산합니다."""
+    pos_x, pos_y = base_pos
+    scaled_pos = (scale_x(pos_x), scale_y(pos_y))
+    pole_height, pole_width = scale_y(60), scale_x(5)
+    pole_rect = pygame.Rect(scaled_pos[0], scaled_pos[1] - pole_height, pole_width, pole_height)
+    cloth_points = ((scaled_pos[0] + pole_width, scaled_pos[1] - pole_height),
+                    (scaled_pos[0] + pole_width, scaled_pos[1] - pole_height + scale_y(25)),
+                    (scaled_pos[0] + pole_width + scale_x(40), scaled_pos[1] - pole_height + scale_y(12.5)))
+    return pole_rect, cloth_points
+
+# ======================================================================================
+# 물리 시스템 관련 함수들
+# ======================================================================================
+def store_previous_transform(obj):
+    """다음 물리 스텝 전에 현재 위치/각도를 보간용으로 저장합니다."""
+    obj.prev_position, obj.prev_angle = obj.body.position, obj.body.angle
+
+def capture_body_state(body):
+    """스냅샷용으로 바디의 위치/속도/각도/각속도를 담아 둡니다."""
+    return (body.position, body.velocity, body.angle, body.angular_velocity)
+
+def restore_body_state(body, state):
+    body.position, body.velocity, body.angle, body.angular_velocity = state
+    body.force, body.torque = (0, 0), 0
+
+def interpolated_transform(obj, alpha):
+    """이전 스텝과 현재 스텝 사이를 alpha(0~1) 비율로 보간한 (위치, 각도)를 반환합니다."""
+    position, angle = obj.body.position, obj.body.angle
+    if alpha >= 1.0: return position, angle
+    prev_position, prev_angle = obj.prev_position, obj.prev_angle
+    return prev_position + (position - prev_position) * alpha, prev_angle + (angle - prev_angle) * alpha
+
+def merge_grid_cells(rows, cells):
+    """격자에서 cells에 속한 칸들을 겹치지 않는 직사각형 (열, 행, 너비, 높이) 목록으로 합칩니다.
+
+    남은 칸으로 만들 수 있는 가장 큰 직사각형부터 차례로 고르는 방식이며,
+    동물 격자는 6x6 이하라 모든 후보를 살펴봐도 충분히 빠릅니다.
+    """
+    height = len(rows)
+    width = max((len(row) for row in rows), default=0)
+    remaining = {(c, r) for r, row in enumerate(rows) for c, char in enumerate(row) if char in cells}
+    rects = []
+    while remaining:
+        best = None
+        for top in range(height):
+            for left in range(width):
+                if (left, top) not in remaining: continue
+                max_w = 0
+                while (left + max_w, top) in remaining: max_w += 1
+                for bottom in range(top, height):
+                    row_w = 0
+                    while row_w < max_w and (left + row_w, bottom) in remaining: row_w += 1
+                    max_w = row_w
+                    if max_w == 0: break
+                    area = max_w * (bottom - top + 1)
+                    if best is None or area > best[2] * best[3]:
+                        best = (left, top, max_w, bottom - top + 1)
+        left, top, rect_w, rect_h = best
+        remaining -= {(left + dc, top + dr) for dr in range(rect_h) for dc in range(rect_w)}
+        rects.append(best)
+    return rects
+
+def add_collision_callbacks(space, type_a, type_b=None, begin=None, pre_solve=None, post_solve=None, separate=None):
+    """충돌 콜백을 등록합니다. type_b가 None이면 type_a와 모든 도형 사이의 충돌에 호출됩니다.
+
+    콜백은 (arbiter, space, data) 형태이며 arbiter.shapes[0]이 항상 type_a 도형입니다.
+    pymunk 6(add_collision_handler)과 7(on_collision)을 모두 지원하며, 콜백 반환값과
+    관계없이 충돌은 평소처럼 처리됩니다.
+    """
+    if hasattr(space, 'on_collision'):
+        space.on_collision(type_a, type_b, begin=begin, pre_solve=pre_solve, post_solve=post_solve, separate=separate)
+        return
+    handler = space.add_collision_handler(type_a, type_b) if type_b is not None else space.add_wildcard_collision_handler(type_a)
+    def always_process(callback):
+        def wrapper(arbiter, space, data):
+            callback(arbiter, space, data)
+            return True
+        return wrapper
+    if begin: handler.begin = always_process(begin)
+    if pre_solve: handler.pre_solve = always_process(pre_solve)
+    if post_solve: handler.post_solve = post_solve
+    if separate: handler.separate = separate
+
+def create_static_body(space, pos, size, category, mask):
+    body = pymunk.Body(body_type=pymunk.Body.STATIC)
+    body.position = pos
+    shape = pymunk.Poly.create_box(body, size)
+    shape.elasticity, shape.friction = 0.4, 0.9
+    shape.color = (0, 0, 0, 0)
+    shape.filter = pymunk.ShapeFilter(categories=category, mask=mask)
+    space.add(body, shape)
+    return body, shape
+
+def setup_level(space, static_body_specs):
+    """컴파일된 스테이지의 정적 바디 목록(지형 + 화면 테두리 벽)을 공간에 추가합니다."""
+    return [create_static_body(space, center, size, category, mask) for center, size, category, mask in static_body_specs]
+
+def create_hazard_sensor(space, hazard_y, radius, width):
+    """화면 폭 전체에 걸친 가시 바닥 센서를 만듭니다. 물리 반응 없이 닿은 것만 알려 줍니다."""
+    body = pymunk.Body(body_type=pymunk.Body.STATIC)
+    shape = pymunk.Segment(body, (scale_x(-20), hazard_y), (width + scale_x(20), hazard_y), radius)
+    shape.sensor = True
+    shape.collision_type = HAZARD_COLLISION_TYPE
+    shape.filter = pymunk.ShapeFilter(categories=TERRAIN_CATEGORY, mask=PLAYER_CATEGORY | ANIMAL_CATEGORY)
+    space.add(body, shape)
+    return body, shape
+
+# ======================================================================================
+# 동물 블록 형태 템플릿 (동물, 블록 크기)별로 한 번만 계산
+# ======================================================================================
+class AnimalTemplate:
+    """ANIMAL_DATA의 격자를 미리 해석해 둔 동물 블록 형태 정보입니다.
+
+    블록을 만들 때마다 격자를 다시 읽지 않도록 직사각형 조각의 꼭짓점, 머리 위치,
+    크기, 질량과 관성, 공용 ShapeFilter를 보관합니다. get_animal_template()으로 얻습니다.
+    """
+
+    def __init__(self, name, block_scale):
+        self.name, self.block_scale = name, block_scale
+        self.rows = ANIMAL_DATA.get(name, [])
+        self.grid_height = len(self.rows)
+        self.grid_width = len(self.rows[0]) if self.grid_height > 0 else 0
+        self.image_size = (int(self.grid_width * block_scale), int(self.grid_height * block_scale))
+        self.cells = [(c, r, char) for r, row in enumerate(self.rows) for c, char in enumerate(row) if char in ('1', '2')]
+
+        width, height, scale = self.grid_width, self.grid_height, block_scale
+        self.head_offsets = []
+        if name in CARNIVORES:
+            self.head_offsets = [pymunk.Vec2d((c - width / 2 + 0.5) * scale, (r - height / 2 + 0.5) * scale) for c, r, char in self.cells if char == '2']
+
+        # 몸통('1')과 머리('2')를 각각 최소한의 직사각형으로 합칩니다. 질량은 칸당 100입니다.
+        self.pieces, piece_masses = [], []
+        for cells in ('1', '2'):
+            for c_index, r_index, rect_w, rect_h in merge_grid_cells(self.rows, cells):
+                left, top = (c_index - width / 2) * scale, (r_index - height / 2) * scale
+                right, bottom = left + rect_w * scale, top + rect_h * scale
+                self.pieces.append(((left, top), (right, top), (right, bottom), (left, bottom)))
+                piece_masses.append(100 * rect_w * rect_h)
+
+        self.mass = sum(piece_masses)
+        self.center_of_gravity = pymunk.Vec2d(0, 0)
+        self.moment = 0
+        if self.mass > 0 and scale > 0:
+            cog_x = sum(m * (v[0][0] + v[2][0]) / 2 for v, m in zip(self.pieces, piece_masses)) / self.mass
+            cog_y = sum(m * (v[0][1] + v[2][1]) / 2 for v, m in zip(self.pieces, piece_masses)) / self.mass
+            self.center_of_gravity = pymunk.Vec2d(cog_x, cog_y)
+            self.moment = sum(pymunk.moment_for_poly(m, v, offset=(-cog_x, -cog_y)) for v, m in zip(self.pieces, piece_masses))
+
+        animal_mask = PLAYER_CATEGORY | ANIMAL_CATEGORY | TERRAIN_CATEGORY
+        self.shape_filter = pymunk.ShapeFilter(categories=ANIMAL_CATEGORY, mask=animal_mask)
+        self.head_sensor_filter = pymunk.ShapeFilter(categories=ANIMAL_CATEGORY, mask=ANIMAL_CATEGORY)
+        self.head_sensor_radius = scale_x(40)
+
+    def palette_size(self, max_dim):
+        """하단 선택 패널에서 긴 변이 max_dim이 되도록 비율을 유지한 크기를 반환합니다."""
+        shape_h = self.grid_height
+        shape_w = self.grid_width if shape_h > 0 else 1
+        aspect_ratio = shape_h / shape_w if shape_w > 0 else 1
+        if shape_w >= shape_h: return max_dim, max_dim * aspect_ratio
+        return max_dim / aspect_ratio, max_dim
+
+_animal_templates = {}
+
+def get_animal_template(name, block_scale):
+    key = (name, block_scale)
+    template = _animal_templates.get(key)
+    if template is None:
+        template = _animal_templates[key] = AnimalTemplate(name, block_scale)
+    return template
+
+def clear_animal_templates():
+    """해상도(블록 크기)가 바뀌면 호출해 캐시를 비웁니다."""
+    _animal_templates.clear()
@@ -0,0 +1,93 @@
+# preloader.py - 시작할 때 에셋을 스레드 풀에서 미리 읽고 로딩 화면을 보여 줍니다.
+#
+# 이미지 디코딩(pygame.image.load)과 사운드 디코딩은 GIL을 놓으므로 여러 파일을 동시에 풀 수 있습니다.
+# 화면 형식으로 바꾸는 convert()/convert_alpha()는 메인 스레드에서 합니다.
+# 첫 메뉴에 필요한 에셋(아틀라스, 배경)이 준비될 때까지만 로딩 화면을 띄우고,
+# 사운드처럼 바로 쓰지 않는 에셋은 메뉴가 뜬 뒤에도 뒤에서 계속 읽습니다.
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import pygame
+from settings import *
+from texture_atlas import preload_atlases, get_atlases
+from asset_cache import asset_cache
+from audio_manager import audio_manager
+from ui_manager import TextSurfaceCache
+
+PRELOAD_WORKERS = max(2, min(4, os.cpu_count() or 1))
+
+class AssetPreloader:
+    """첫 화면에 필요한(critical) 에셋과 나중에 써도 되는 에셋을 나눠 작업 스레드에 맡깁니다."""
+
+    def __init__(self, workers=PRELOAD_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preload")
+        self.critical_futures = []
+        self.background_futures = []
+
+    def start(self, critical_images=()):
+        """첫 화면에 필요한 에셋을 맡깁니다. images는 (경로, 알파 여부) 목록이고 아틀라스는 항상 포함됩니다."""
+        self.critical_futures += preload_atlases(self.executor)
+        for path, alpha in critical_images:
+            future = asset_cache.preload(self.executor, path, alpha)
+            if future is not None: self.critical_futures.append(future)
+
+    def start_background(self, images=()):
+        """critical 에셋을 등록한 뒤 호출합니다. 사운드와 나머지 이미지를 뒤에서 읽고, 끝나면 스레드를 정리합니다.
+
+        critical 작업과 같은 때 맡기면 작업 스레드를 나눠 쓰느라 로딩 화면이 오히려 길어집니다.
+        """
+        for path, alpha in images:
+            future = asset_cache.preload(self.executor, path, alpha)
+            if future is not None: self.background_futures.append(future)
+        self.background_futures += audio_manager.preload_sounds(self.executor)
+        self.executor.shutdown(wait=False)
+
+    @property
+    def critical_progress(self):
+        """(끝난 critical 작업 수, 전체 critical 작업 수)"""
+        return sum(future.done() for future in self.critical_futures), len(self.critical_futures)
+
+    def wait_critical(self, timeout):
+        """critical 작업 하나가 끝나거나 timeout초가 지날 때까지 기다립니다."""
+        pending = [future for future in self.critical_futures if not future.done()]
+        if pending: wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+    def finish_critical(self):
+        """디코딩이 끝난 critical 에셋을 메인 스레드에서 convert해 등록합니다."""
+        get_atlases()
+        asset_cache.finish_preloads()
+
+def draw_loading_splash(screen, fonts, text_cache, done, total):
+    width, height = screen.get_size()
+    screen.fill(BACKGROUND_COLOR)
+    title = text_cache.render(fonts['title_large'], "Animal Bridge", WHITE)
+    screen.blit(title, title.get_rect(center=(width / 2, height / 2 - scale_y(80))))
+
+    bar_rect = pygame.Rect(0, 0, scale_x(500), scale_y(24))
+    bar_rect.center = (width / 2, height / 2 + scale_y(40))
+    fill_rect = bar_rect.inflate(-scale_x(8), -scale_y(8))
+    fill_rect.width = int(fill_rect.width * (done / total if total else 1.0))
+    pygame.draw.rect(screen, WHITE, bar_rect, 2, int(scale_x(6)))
+    if fill_rect.width > 0: pygame.draw.rect(screen, ACTIVE_BORDER_COLOR, fill_rect, 0, int(scale_x(4)))
+
+    label = text_cache.render(fonts['body_small'], f"로딩 중... {done}/{total}", GRAY)
+    screen.blit(label, label.get_rect(center=(width / 2, bar_rect.bottom + scale_y(40))))
+
+def run_loading_splash(screen, clock, fonts, preloader):
+    """critical 에셋이 모두 준비될 때까지 진행 막대를 그리고, 준비되면 메인 스레드에서 등록합니다.
+
+    UI 관리자가 만들어지기 전이므로 로딩 화면 전용 글자 캐시를 씁니다. 진행 글자는 작업이 끝날 때만 바뀝니다.
+    """
+    text_cache = TextSurfaceCache(max_entries=32)
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
+        done, total = preloader.critical_progress
+        draw_loading_splash(screen, fonts, text_cache, done, total)
+        pygame.display.flip()
+        if done == total: break
+        # 고정 간격으로 쉬지 않고 작업이 끝나는 즉시 막대를 갱신합니다.
+        preloader.wait_critical(1.0 / FPS)
+    preloader.finish_critical()
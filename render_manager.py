@@ -1,102 +1,154 @@
 # render_manager.py
 
+import os
 import pygame
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional
 from tilemap_renderer import TileMapManager
-from ui_manager import UIManager
+from ui_manager import UIManager, DirtyRegionTracker
 from audio_manager import audio_manager
 from settings import *
 from settings import resource_path
+from sprite_cache import rotation_cache, shrink_frame_cache
+from asset_cache import asset_cache
+from frame_profiler import profiler
+
+BACKGROUND_PATH = "assets/bg/background.png"
+OPENING_BACKGROUNDS = [
+    "assets/bg/AnimalBridge_opening_gray.png",
+    "assets/bg/AnimalBridge_opening_green.png",
+    "assets/bg/AnimalBridge_opening_ivory.png",
+    "assets/bg/AnimalBridge_opening_violet.png",
+    "assets/bg/AnimalBridge_opening_yellow.png"
+]
+
+def shuffled_opening_backgrounds() -> List[str]:
+    """오프닝 배경 후보를 무작위 순서로 반환합니다. 첫 번째 것만 읽고, 없을 때만 다음 것을 씁니다."""
+    paths = list(OPENING_BACKGROUNDS)
+    random.shuffle(paths)
+    return paths
 
 class RenderManager:
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, opening_paths: Optional[List[str]] = None):
         self.screen = screen
         self.tilemap_manager = TileMapManager()
         self.ui_manager = UIManager(screen)
+        # 메뉴 화면은 바뀐 위젯 영역만 화면에 반영합니다.
+        self.dirty_regions = DirtyRegionTracker(screen)
         self.width = screen.get_width()
         self.height = screen.get_height()
         
-        # 기존 배경 이미지
+        # 배경 이미지: 원본은 메모리에 두고, 해상도가 바뀌면 원본에서 다시 스케일링합니다.
+        # 로딩 화면에서 미리 디코딩해 두었으면 에셋 캐시에서 바로 꺼냅니다.
         try:
-            self.background_image = pygame.image.load(resource_path("assets/bg/background.png")).convert()
-        except FileNotFoundError:
-            self.background_image = None
+            self.background_original = asset_cache.image(BACKGROUND_PATH, alpha=False)
+        except (pygame.error, OSError):
+            self.background_original = None
             
-        # 오프닝 이미지들 로드 및 랜덤 선택
-        self.opening_backgrounds = []
-        opening_files = [
-            "AnimalBridge_opening_gray.png",
-            "AnimalBridge_opening_green.png", 
-            "AnimalBridge_opening_ivory.png",
-            "AnimalBridge_opening_violet.png",
-            "AnimalBridge_opening_yellow.png"
-        ]
-        
-        for filename in opening_files:
+        # 오프닝 이미지 중 하나를 랜덤으로 골라 그 원본만 로드합니다.
+        self.opening_original = None
+        for path in opening_paths or shuffled_opening_backgrounds():
             try:
-                original_image = pygame.image.load(resource_path(f"assets/bg/{filename}")).convert()
-                scaled_image = pygame.transform.scale(original_image, (self.width, self.height))
-                self.opening_backgrounds.append(scaled_image)
-                print(f"✓ 오프닝 배경 로드 성공: {filename}")
-            except FileNotFoundError:
-                print(f"✗ 오프닝 배경 로드 실패: {filename}")
+                self.opening_original = asset_cache.image(path, alpha=False)
+                print(f"✓ 오프닝 배경 로드 성공: {os.path.basename(path)}")
+                break
+            except (pygame.error, OSError):
+                print(f"✗ 오프닝 배경 로드 실패: {os.path.basename(path)}")
         
-        # 랜덤하게 하나 선택 (이미지가 있을 경우)
-        if self.opening_backgrounds:
-            self.current_opening_background = random.choice(self.opening_backgrounds)
-        else:
-            self.current_opening_background = None
+        if self.opening_original is None:
             print("⚠️ 사용 가능한 오프닝 배경 이미지가 없습니다.")
+        # 배경 스케일링은 작업 스레드에서 하고, 처음 그릴 때 결과를 받습니다.
+        self.scale_executor = ThreadPoolExecutor(max_workers=1)
+        self.background_futures = {}   # (너비, 높이) -> (배경, 오프닝 배경)을 만드는 Future
+        self._backgrounds, self._backgrounds_future = (None, None), None
+        self._scale_backgrounds()
         
         # 폰트 초기화 추가
         self.fonts = init_fonts()
         
         self.text_surface_cache = None
 
-    def update_screen_size(self, width: int, height: int):
+        # 정적 레이어 캐시: (스테이지, 해상도)별로 배경 + 지형 + 가시 바닥을 한 장에 구워 둡니다.
+        self.static_layers = {}
+        self.max_static_layers = 4
+
+    def _scale_backgrounds_for(self, size):
+        """원본 배경을 size 해상도에 맞춘 (배경, 오프닝 배경)을 만듭니다. 작업 스레드에서 실행됩니다.
+
+        배경은 기준 해상도에서 보이던 왼쪽 위 영역만 잘라 화면 크기로 늘려서 어느 해상도에서나 같은 구도로 보이고,
+        오프닝 배경은 화면 크기에 꼭 맞춥니다. 원본은 이 스레드에서만 만지도록 항상 새 Surface를 돌려줍니다.
+        """
+        width, height = size
+        background = opening = None
+        if self.background_original is not None:
+            visible = self.background_original.subsurface(pygame.Rect(0, 0, BASE_WIDTH, BASE_HEIGHT).clip(self.background_original.get_rect()))
+            scaled_size = (round(visible.get_width() * width / BASE_WIDTH), round(visible.get_height() * height / BASE_HEIGHT))
+            background = visible.copy() if scaled_size == visible.get_size() else pygame.transform.scale(visible, scaled_size)
+        if self.opening_original is not None:
+            opening = self.opening_original.copy() if self.opening_original.get_size() == size else pygame.transform.scale(self.opening_original, size)
+        return background, opening
+
+    def prefetch_screen_sizes(self, sizes):
+        """곧 바뀔 수 있는 해상도(설정 화면의 해상도 목록)의 배경을 미리 작업 스레드에서 스케일링해 둡니다."""
+        for size in sizes:
+            if size != (self.width, self.height) and size not in self.background_futures:
+                self.background_futures[size] = self.scale_executor.submit(self._scale_backgrounds_for, size)
+
+    def _scale_backgrounds(self):
+        size = (self.width, self.height)
+        future = self.background_futures.pop(size, None)
+        self._backgrounds_future = future or self.scale_executor.submit(self._scale_backgrounds_for, size)
+        # 다른 해상도용으로 미리 만들어 둔 결과는 쓸 일이 없으면 메모리만 차지하므로 버립니다.
+        self.background_futures.clear()
+
+    def _current_backgrounds(self):
+        if self._backgrounds_future is not None:
+            self._backgrounds = self._backgrounds_future.result()
+            self._backgrounds_future = None
+        return self._backgrounds
+
+    @property
+    def background_image(self) -> Optional[pygame.Surface]:
+        return self._current_backgrounds()[0]
+
+    @property
+    def current_opening_background(self) -> Optional[pygame.Surface]:
+        return self._current_backgrounds()[1]
+
+    def update_screen_size(self, width: int, height: int, screen: Optional[pygame.Surface] = None):
+        """해상도가 바뀐 뒤 호출합니다. 메모리에 있는 원본으로 다시 만들고 파일은 읽지 않습니다."""
+        if screen is not None: self.screen = screen
         self.width = width; self.height = height
         self.ui_manager.screen = self.screen
-        
-        # 기존 배경 이미지 스케일링
-        if self.background_image:
-            self.background_image = pygame.transform.scale(self.background_image, (width, height))
-        
-        # 오프닝 배경들 다시 스케일링
-        opening_files = [
-            "AnimalBridge_opening_gray.png",
-            "AnimalBridge_opening_green.png", 
-            "AnimalBridge_opening_ivory.png",
-            "AnimalBridge_opening_violet.png",
-            "AnimalBridge_opening_yellow.png"
-        ]
-        
-        self.opening_backgrounds.clear()
-        for filename in opening_files:
-            try:
-                original_image = pygame.image.load(resource_path(f"assets/bg/{filename}")).convert()
-                scaled_image = pygame.transform.scale(original_image, (width, height))
-                self.opening_backgrounds.append(scaled_image)
-            except FileNotFoundError:
-                pass
-        
-        # 현재 선택된 배경도 다시 스케일링
-        if self.opening_backgrounds:
-            self.current_opening_background = random.choice(self.opening_backgrounds)
+        self.dirty_regions.screen = self.screen
+        self.dirty_regions.invalidate()
+        self.ui_manager.text_cache.clear()
+        self.ui_manager.overlay_pool.clear()
+        rotation_cache.clear()
+        shrink_frame_cache.clear()
+        asset_cache.clear_scaled()
+
+        self._scale_backgrounds()
+        self.tilemap_manager.update_resolution()
+        self.fonts = init_fonts()
         
         self.text_surface_cache = None
+        self.static_layers.clear()
 
-    def render_background(self, type: str = "default"):
+    def render_background(self, type: str = "default", surface: Optional[pygame.Surface] = None):
+        surface = self.screen if surface is None else surface
         if self.background_image: 
-            self.screen.blit(self.background_image, (0, 0))
+            surface.blit(self.background_image, (0, 0))
         else: 
-            self.screen.fill(BACKGROUND_COLOR)
+            surface.fill(BACKGROUND_COLOR)
 
     def render_terrain(self, terrain_rects: List[pygame.Rect]):
         self.tilemap_manager.terrain_renderer.render_terrain(self.screen, terrain_rects)
 
-    def render_hazard_floor(self):
+    def render_hazard_floor(self, surface: Optional[pygame.Surface] = None):
         """화면 하단에 가시 바닥을 그립니다."""
+        surface = self.screen if surface is None else surface
         spike_color = (60, 60, 65)
         spike_shadow_color = (40, 40, 45)
         spike_width = scale_x(30)
@@ -112,14 +164,37 @@ class RenderManager:
                 (x + spike_width / 2 + 2, base_y),
                 (x + 2, base_y - spike_height)
             ]
-            pygame.draw.polygon(self.screen, spike_shadow_color, shadow_points)
+            pygame.draw.polygon(surface, spike_shadow_color, shadow_points)
 
             points = [
                 (x - spike_width / 2, base_y),
                 (x + spike_width / 2, base_y),
                 (x, base_y - spike_height)
             ]
-            pygame.draw.polygon(self.screen, spike_color, points)
+            pygame.draw.polygon(surface, spike_color, points)
+
+    def get_static_layer(self, stage) -> pygame.Surface:
+        """컴파일된 스테이지의 움직이지 않는 레이어(배경, 지형 타일, 가시 바닥)를 한 장으로 구워 반환합니다."""
+        key = (stage.stage_level, self.width, self.height)
+        layer = self.static_layers.pop(key, None)
+        if layer is None:
+            layer = pygame.Surface((self.width, self.height)).convert()
+            self.render_background("tilemap", layer)
+            self.tilemap_manager.terrain_renderer.render_terrain(layer, stage.terrain_rects)
+            if stage.has_hazard_floor: self.render_hazard_floor(layer)
+            while len(self.static_layers) >= self.max_static_layers:
+                self.static_layers.pop(next(iter(self.static_layers)))
+        self.static_layers[key] = layer  # 가장 최근에 쓴 레이어를 맨 뒤로
+        return layer
+
+    def render_play_scene(self, sim, alpha: float = 1.0):
+        """스테이지 시뮬레이션의 월드를 그립니다. 정적 레이어는 전체 화면 한 번의 blit으로 끝납니다."""
+        self.screen.blit(self.get_static_layer(sim.stage), (0, 0))
+        profiler.mark("world")
+        sim.player.draw(self.screen, alpha)
+        for animal in sim.game_objects: animal.draw(self.screen, alpha)
+        sim.goal_flag.draw(self.screen)
+        profiler.mark("entities")
 
     def render_stage1_tutorial(self):
         """1스테이지 시작 시 튜토리얼 팝업을 그립니다."""
@@ -166,7 +241,7 @@ class RenderManager:
             self.screen.fill(WHITE)
         
         # 배경과 상관없이 항상 실행되어야 하는 UI 요소들
-        name_surf = fonts['name'].render(player_name, True, BLACK)
+        name_surf = self.ui_manager.render_text(player_name, fonts['name'], BLACK)
         name_rect = name_surf.get_rect(right=self.width - scale_x(40), top=scale_y(40))
         self.ui_manager.draw_panel(name_rect.inflate(scale_x(20), scale_y(10)), GRAY, border_color=GRAY, border_width=0, border_radius=5)
         self.screen.blit(name_surf, name_rect)
@@ -225,7 +300,7 @@ class RenderManager:
         button_font = self.fonts['button_small']
 
         self.ui_manager.draw_panel(panel_rect, (40, 40, 50, 230), WHITE, 3, 15)
-        title_surf = title_font.render("게임 설명", True, WHITE)
+        title_surf = self.ui_manager.render_text("게임 설명", title_font, WHITE)
         self.screen.blit(title_surf, title_surf.get_rect(center=(panel_rect.centerx, panel_rect.top + scale_y(60))))
         
         self.ui_manager.draw_scrollable_text(text_surface, text_area_rect, scroll_y)
@@ -234,12 +309,18 @@ class RenderManager:
         self.ui_manager.draw_interactive_button(back_button_rect, button_text, button_font, (220, 220, 220), WHITE, (100, 100, 100))
 
     def prepare_settings_assets(self):
-        settings_bg_rect = pygame.Rect(0, 0, scale_x(1280 - 400), scale_y(720 - 400)); settings_bg_rect.center = (self.width / 2, self.height / 2)
+        settings_bg_rect = pygame.Rect(0, 0, scale_x(1280 - 400), scale_y(720 - 300)); settings_bg_rect.center = (self.width / 2, self.height / 2)
         back_button_rect = pygame.Rect(0, 0, scale_x(220), scale_y(70)); back_button_rect.center = (self.width / 2, settings_bg_rect.bottom - scale_y(60))
-        y_pos_sound = settings_bg_rect.centery
+        y_pos_sound = settings_bg_rect.centery - scale_y(40)
         sound_slider_rect = pygame.Rect(0, 0, scale_x(300), scale_y(15)); sound_slider_rect.midleft = (settings_bg_rect.centerx - scale_x(130), y_pos_sound)
         sound_handle_rect = pygame.Rect(0, 0, scale_x(20), scale_y(40)); sound_handle_rect.centery = sound_slider_rect.centery
-        return {'settings_bg': settings_bg_rect, 'back_button': back_button_rect, 'sound_slider': sound_slider_rect, 'sound_handle': sound_handle_rect}
+        # 해상도 선택: 슬라이더 왼쪽 끝에 맞춰 < 1600 x 900 > 형태로 그립니다.
+        y_pos_resolution = settings_bg_rect.centery + scale_y(40)
+        resolution_rect = pygame.Rect(0, 0, scale_x(400), scale_y(50)); resolution_rect.midleft = (sound_slider_rect.left, y_pos_resolution)
+        resolution_left = pygame.Rect(0, 0, scale_x(50), scale_y(50)); resolution_left.midleft = resolution_rect.midleft
+        resolution_right = pygame.Rect(0, 0, scale_x(50), scale_y(50)); resolution_right.midright = resolution_rect.midright
+        return {'settings_bg': settings_bg_rect, 'back_button': back_button_rect, 'sound_slider': sound_slider_rect, 'sound_handle': sound_handle_rect,
+                'resolution': resolution_rect, 'resolution_left': resolution_left, 'resolution_right': resolution_right}
 
     def render_settings_screen(self, temp_volume, ui_elements):
         self.render_background()
@@ -256,12 +337,22 @@ class RenderManager:
         sound_handle_rect.centerx = sound_slider_rect.left + (sound_slider_rect.width * temp_volume)
 
         self.ui_manager.draw_panel(settings_bg_rect, (230, 230, 230, 220), BLACK, 3, 15)
-        title_surf = fonts['title'].render("설정", True, BLACK)
+        title_surf = self.ui_manager.render_text("설정", fonts['title'], BLACK)
         self.screen.blit(title_surf, title_surf.get_rect(center=(settings_bg_rect.centerx, settings_bg_rect.top + scale_y(70))))
         
-        sound_text_surf = fonts['option'].render("사운드", True, BLACK)
+        sound_text_surf = self.ui_manager.render_text("사운드", fonts['option'], BLACK)
         self.screen.blit(sound_text_surf, sound_text_surf.get_rect(midright=(sound_slider_rect.left - scale_x(20), sound_slider_rect.centery)))
         self.ui_manager.draw_slider(sound_slider_rect, sound_handle_rect, WHITE, (150, 150, 150), BLACK)
+
+        resolution_rect = ui_elements['resolution']
+        resolution_text_surf = self.ui_manager.render_text("해상도", fonts['option'], BLACK)
+        self.screen.blit(resolution_text_surf, resolution_text_surf.get_rect(midright=(resolution_rect.left - scale_x(20), resolution_rect.centery)))
+        mouse_pos = pygame.mouse.get_pos()
+        for arrow_text, arrow_key in (("<", 'resolution_left'), (">", 'resolution_right')):
+            arrow_rect = ui_elements[arrow_key]
+            arrow_surf = self.ui_manager.render_text(arrow_text, fonts['option'], BLACK if arrow_rect.collidepoint(mouse_pos) else (120, 120, 120))
+            self.screen.blit(arrow_surf, arrow_surf.get_rect(center=arrow_rect.center))
+        self.ui_manager.draw_centered_text(f"{self.width} x {self.height}", self.fonts['body_medium'], BLACK, resolution_rect.center)
         self.ui_manager.draw_interactive_button(ui_elements['back_button'], "뒤로 가기", fonts['button'], (220, 220, 220), WHITE, (100, 100, 100))
 
     def prepare_ranking_assets(self):
@@ -284,19 +375,28 @@ class RenderManager:
         left_arrow, right_arrow, back_button = self.prepare_ranking_assets()
         mouse_pos = pygame.mouse.get_pos()
         left_color = WHITE if left_arrow.collidepoint(mouse_pos) else GRAY; right_color = WHITE if right_arrow.collidepoint(mouse_pos) else GRAY
-        self.screen.blit(fonts['arrow'].render("<", True, left_color), fonts['arrow'].render("<", True, left_color).get_rect(center=left_arrow.center))
-        self.screen.blit(fonts['arrow'].render(">", True, right_color), fonts['arrow'].render(">", True, right_color).get_rect(center=right_arrow.center))
+        render_text = self.ui_manager.render_text
+        left_surf, right_surf = render_text("<", fonts['arrow'], left_color), render_text(">", fonts['arrow'], right_color)
+        self.screen.blit(left_surf, left_surf.get_rect(center=left_arrow.center))
+        self.screen.blit(right_surf, right_surf.get_rect(center=right_arrow.center))
         start_y = title_rect_center_y + scale_y(100)
-        if not ranking_data: self.screen.blit(fonts['rank'].render("기록이 없습니다", True, GRAY), fonts['rank'].render("기록이 없습니다", True, GRAY).get_rect(center=(self.width / 2, start_y + scale_y(100))))
+        if not ranking_data:
+            empty_surf = render_text("기록이 없습니다", fonts['rank'], GRAY)
+            self.screen.blit(empty_surf, empty_surf.get_rect(center=(self.width / 2, start_y + scale_y(100))))
         else:
             for i, record in enumerate(ranking_data):
                 entry_rect = pygame.Rect(0, 0, self.width - scale_x(300), scale_y(70)); entry_rect.center = (self.width / 2, start_y + i * scale_y(80))
                 self.ui_manager.draw_panel(entry_rect, (240, 240, 240, 200), BLACK, 2, 10)
-                self.screen.blit(fonts['rank'].render(f"#{i+1}", True, BLACK), fonts['rank'].render(f"#{i+1}", True, BLACK).get_rect(center=(entry_rect.left + scale_x(50), entry_rect.centery)))
-                self.screen.blit(fonts['rank'].render(record["name"], True, BLACK), fonts['rank'].render(record["name"], True, BLACK).get_rect(midleft=(entry_rect.left + scale_x(110), entry_rect.centery)))
-                self.screen.blit(fonts['rank'].render(f"{record['time']:.2f} 초", True, (50, 50, 50)), fonts['rank'].render(f"{record['time']:.2f} 초", True, (50,50,50)).get_rect(center=(entry_rect.centerx, entry_rect.centery)))
-                self.screen.blit(fonts['rank'].render(f"사용: {record['blocks']}개", True, (50, 50, 50)), fonts['rank'].render(f"사용: {record['blocks']}개", True, (50,50,50)).get_rect(midright=(entry_rect.right - scale_x(160), entry_rect.centery)))
-                self.screen.blit(fonts['rank'].render(f"먹힘: {record.get('eaten', 0)}개", True, (50, 50, 50)), fonts['rank'].render(f"먹힘: {record.get('eaten', 0)}개", True, (50,50,50)).get_rect(midright=(entry_rect.right - scale_x(30), entry_rect.centery)))
+                rank_surf = render_text(f"#{i+1}", fonts['rank'], BLACK)
+                name_surf = render_text(record["name"], fonts['rank'], BLACK)
+                time_surf = render_text(f"{record['time']:.2f} 초", fonts['rank'], (50, 50, 50))
+                blocks_surf = render_text(f"사용: {record['blocks']}개", fonts['rank'], (50, 50, 50))
+                eaten_surf = render_text(f"먹힘: {record.get('eaten', 0)}개", fonts['rank'], (50, 50, 50))
+                self.screen.blit(rank_surf, rank_surf.get_rect(center=(entry_rect.left + scale_x(50), entry_rect.centery)))
+                self.screen.blit(name_surf, name_surf.get_rect(midleft=(entry_rect.left + scale_x(110), entry_rect.centery)))
+                self.screen.blit(time_surf, time_surf.get_rect(center=(entry_rect.centerx, entry_rect.centery)))
+                self.screen.blit(blocks_surf, blocks_surf.get_rect(midright=(entry_rect.right - scale_x(160), entry_rect.centery)))
+                self.screen.blit(eaten_surf, eaten_surf.get_rect(midright=(entry_rect.right - scale_x(30), entry_rect.centery)))
         self.ui_manager.draw_interactive_button(back_button, "뒤로 가기", fonts['button'], (220, 220, 220), WHITE, (100, 100, 100))
 
     def render_stage_select(self, stage_rects, selected_stage_num, back_button_rect, scroll_y, scroll_bar_rect, content_height, view_height, highest_unlocked: int):
@@ -326,11 +426,11 @@ class RenderManager:
 
                 text_color = BLACK if not is_locked else GRAY
 
-                num_text = fonts['stage_num'].render(f"{stage_num}", True, text_color)
+                num_text = self.ui_manager.render_text(f"{stage_num}", fonts['stage_num'], text_color)
                 self.screen.blit(num_text, num_text.get_rect(center=(visible_rect.left + scale_x(60), visible_rect.centery)))
 
                 stage_name = STAGE_DATA.get(str(stage_num), {}).get("name", f"스테이지 {stage_num}")
-                name_text = fonts['stage_title'].render(stage_name, True, text_color)
+                name_text = self.ui_manager.render_text(stage_name, fonts['stage_title'], text_color)
                 self.screen.blit(name_text, name_text.get_rect(midleft=(visible_rect.left + scale_x(120), visible_rect.centery)))
                 
                 if is_locked:
@@ -356,7 +456,7 @@ class RenderManager:
 
         self.ui_manager.draw_interactive_button(back_button_rect, "뒤로 가기", fonts['feature'], (220, 220, 220), WHITE, (100, 100, 100))
     
-    def render_game_ui(self, ui_animals: list, dragging_animal: Optional[dict], animal_usage_counts: dict, stats: dict, fonts: dict, restart_button_rect: pygame.Rect, start_time: int):
+    def render_game_ui(self, ui_animals: list, dragging_animal: Optional[dict], animal_usage_counts: dict, stats: dict, fonts: dict, restart_button_rect: pygame.Rect, elapsed_seconds: float):
         self.ui_manager.draw_game_ui_panel(pygame.Rect(0, self.height - scale_y(120), self.width, scale_y(120)))
         
         count_font = self.fonts['count']
@@ -373,8 +473,8 @@ class RenderManager:
             if count == 0:
                 self.ui_manager.draw_disabled_overlay(ui_animal.rect)
 
-            count_surf = count_font.render(str(count), True, WHITE)
-            count_shadow_surf = count_font.render(str(count), True, BLACK)
+            count_surf = self.ui_manager.render_text(str(count), count_font, WHITE)
+            count_shadow_surf = self.ui_manager.render_text(str(count), count_font, BLACK)
             count_rect = count_surf.get_rect(bottomright=(ui_animal.rect.right - scale_x(5), ui_animal.rect.bottom - scale_y(5)))
             shadow_rect = count_shadow_surf.get_rect(bottomright=(count_rect.right + scale_x(1), count_rect.bottom + scale_y(1)))
             
@@ -387,14 +487,13 @@ class RenderManager:
         button_font = self.fonts['count']
         self.ui_manager.draw_interactive_button(restart_button_rect, "다시 시작", button_font, (220, 220, 220), WHITE, (100, 100, 100))
 
-        elapsed_seconds = (pygame.time.get_ticks() - start_time) / 1000
         minutes = int(elapsed_seconds // 60)
         seconds = int(elapsed_seconds % 60)
         time_str = f"{minutes:02}:{seconds:02}"
 
         timer_font = self.fonts['timer']
-        time_surf = timer_font.render(time_str, True, WHITE)
-        time_shadow_surf = timer_font.render(time_str, True, (0, 0, 0, 150))
+        time_surf = self.ui_manager.render_text(time_str, timer_font, WHITE)
+        time_shadow_surf = self.ui_manager.render_text(time_str, timer_font, (0, 0, 0, 150))
 
         time_rect = time_surf.get_rect(topright=(self.width - scale_x(20), scale_y(15)))
         shadow_rect = time_shadow_surf.get_rect(topright=(time_rect.right + scale_x(2), time_rect.top + scale_y(2)))
@@ -409,7 +508,7 @@ class RenderManager:
         drop_zone = pygame.Rect(drop_zone_x, scale_y(30), drop_zone_width, scale_y(130))
         pygame.draw.rect(self.screen, (0, 255, 0, 50), drop_zone, int(scale_x(2)))
         if dragging_animal["image"]:
-            rotated_image = pygame.transform.rotate(dragging_animal["image"], -dragging_animal["angle_degrees"])
+            rotated_image = rotation_cache.rotated(dragging_animal["name"], dragging_animal["image"], -dragging_animal["angle_degrees"])
             self.screen.blit(rotated_image, rotated_image.get_rect(center=(mouse_x, mouse_y)))
         else:
             rect = pygame.Rect(mouse_x - scale_x(30), mouse_y - scale_y(30), scale_x(60), scale_y(60))
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# replay.py - 입력 기록 및 결정적 리플레이
+#
+# game_play_logic 세션의 물리 스텝별 입력(이동 방향, 점프, 회전, 블록 설치)을 작게 기록해 두고,
+# 같은 입력을 StageSimulation에 다시 넣어 그대로 재현합니다. 이동 방향은 바뀐 스텝만,
+# 점프/회전/설치는 일어난 스텝만 저장하므로 아무 입력이 없는 스텝은 파일에 남지 않습니다.
+#
+# 사용 예:
+#   python replay.py replays/stage3_20250101_120000_000.json              # 창 없이 최대 속도로 검증
+#   python replay.py replays/stage3_20250101_120000_000.json --render --speed 8
+
+import os
+import sys
+import json
+import time
+import glob
+import argparse
+from datetime import datetime
+
+import pygame
+import pymunk
+import settings
+from settings import *
+from stage_simulation import StageSimulation, FixedStepAccumulator
+from game_objects import clear_animal_templates
+
+REPLAY_DIR = 'replays'
+MAX_REPLAY_FILES = 30   # 이보다 오래된 리플레이 파일은 저장할 때 지웁니다.
+REPLAY_VERSION = 1
+
+# ======================================================================================
+# 기록
+# ======================================================================================
+class ReplayRecorder:
+    """물리 스텝마다 StageSimulation.step()에 들어간 입력을 압축해 모읍니다.
+
+    기록 한 줄은 [스텝, 이동] 또는 [스텝, 이동, 점프, 회전, [[동물, x, y, 각도], ...]] 형태입니다.
+    """
+
+    def __init__(self, stage_level):
+        self.stage_level = stage_level
+        self.records = []
+        self.last_move = 0
+        self.step_total = 0
+        self.started_at = datetime.now()
+
+    def record(self, step_index, inputs):
+        self.step_total = step_index + 1
+        move = inputs.get("move", 0)
+        jump, rotate = bool(inputs.get("jump")), bool(inputs.get("rotate"))
+        drops = inputs.get("drops", ())
+        if move == self.last_move and not (jump or rotate or drops): return
+        self.last_move = move
+        entry = [step_index, move]
+        if jump or rotate or drops:
+            entry += [int(jump), int(rotate), [[name, pos[0], pos[1], angle_degrees] for name, pos, angle_degrees in drops]]
+        self.records.append(entry)
+
+    def to_dict(self, sim):
+        return {
+            "version": REPLAY_VERSION,
+            "stage": self.stage_level,
+            "resolution": [settings.WIDTH, settings.HEIGHT],
+            "physics_hz": PHYSICS_HZ,
+            "substeps": sim.substeps,
+            "pymunk": pymunk.version,
+            "steps": self.step_total,
+            "records": self.records,
+            "result": replay_outcome(sim),
+        }
+
+    def save(self, sim, path=None):
+        """리플레이를 JSON으로 저장하고 경로를 반환합니다. 한 스텝도 돌지 않았으면 저장하지 않습니다."""
+        if self.step_total == 0: return None
+        if path is None:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            path = os.path.join(REPLAY_DIR, f"stage{self.stage_level}_{self.started_at:%Y%m%d_%H%M%S}_{self.started_at.microsecond // 1000:03d}.json")
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(sim), f, separators=(',', ':'))
+        except OSError as e:
+            print(f"✗ 리플레이 저장 실패: {e}")
+            return None
+        prune_replays()
+        return path
+
+def replay_outcome(sim):
+    """재현 여부를 비교할 최종 상태 요약 (결과 + 플레이어 최종 위치)."""
+    x, y = sim.player.body.position
+    return dict(sim.result(), cleared=sim.is_cleared, player=[round(x, 3), round(y, 3)])
+
+def prune_replays(directory=REPLAY_DIR, keep=MAX_REPLAY_FILES):
+    files = sorted(glob.glob(os.path.join(directory, "stage*.json")), key=os.path.getmtime)
+    for old_path in files[:-keep]:
+        try: os.remove(old_path)
+        except OSError: pass
+
+# ======================================================================================
+# 재생
+# ======================================================================================
+def load_replay(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        replay = json.load(f)
+    if replay.get("version") != REPLAY_VERSION:
+        raise ValueError(f"지원하지 않는 리플레이 버전입니다: {replay.get('version')}")
+    return replay
+
+def iter_replay_inputs(replay):
+    """기록을 풀어 스텝마다 step()에 넣을 입력 딕셔너리를 순서대로 돌려줍니다."""
+    records = {entry[0]: entry for entry in replay["records"]}
+    move = 0
+    for step_index in range(replay["steps"]):
+        inputs = {"move": move, "jump": False, "drops": [], "rotate": False}
+        entry = records.get(step_index)
+        if entry:
+            move = inputs["move"] = entry[1]
+            if len(entry) > 2:
+                inputs["jump"], inputs["rotate"] = bool(entry[2]), bool(entry[3])
+                inputs["drops"] = [(name, (x, y), angle_degrees) for name, x, y, angle_degrees in entry[4]]
+        yield inputs
+
+def apply_replay_resolution(replay):
+    """기록할 때의 해상도로 바꿉니다. 스테이지 좌표와 블록 크기가 해상도를 따르므로 다르면 재현되지 않습니다."""
+    width, height = replay["resolution"]
+    if (width, height) == (settings.WIDTH, settings.HEIGHT): return
+    settings.set_resolution(width, height)
+    clear_animal_templates()
+
+def check_replay_environment(replay):
+    """재현 결과에 영향을 주는 환경 차이를 경고 목록으로 반환합니다.
+
+    해상도는 apply_replay_resolution()이 기록대로 맞추므로 여기서 보지 않습니다.
+    """
+    warnings = []
+    if replay["physics_hz"] != PHYSICS_HZ: warnings.append(f"PHYSICS_HZ {replay['physics_hz']} → {PHYSICS_HZ}")
+    if replay["pymunk"] != pymunk.version: warnings.append(f"pymunk {replay['pymunk']} → {pymunk.version}")
+    return warnings
+
+def play_replay(replay, speed=None, render_manager=None, clock=None, on_step=None):
+    """리플레이를 재생하고 (시뮬레이션, 기록된 결과와 일치 여부)를 반환합니다.
+
+    speed가 None이면 최대 속도, 숫자면 실시간의 그 배수로 진행합니다.
+    render_manager를 주면 매 프레임 월드를 그리고, 없으면 창 없이 시뮬레이션만 돌립니다.
+    현재 해상도가 기록과 다르면 재현할 수 없으므로 ValueError를 냅니다 (apply_replay_resolution() 참고).
+    """
+    if tuple(replay["resolution"]) != (settings.WIDTH, settings.HEIGHT):
+        raise ValueError(f"리플레이 해상도 {replay['resolution']}와 현재 해상도 {[settings.WIDTH, settings.HEIGHT]}가 다릅니다.")
+    sim = StageSimulation(replay["stage"], headless=render_manager is None, substeps=replay["substeps"])
+    step_dt = 1.0 / replay["physics_hz"]
+    inputs_iter = iter_replay_inputs(replay)
+
+    if render_manager is None:
+        started = time.perf_counter()
+        for step_index, inputs in enumerate(inputs_iter):
+            events = sim.step(step_dt, inputs)
+            if on_step: on_step(sim, events)
+            if speed:
+                ahead = (step_index + 1) * step_dt / speed - (time.perf_counter() - started)
+                if ahead > 0: time.sleep(ahead)
+    else:
+        clock = clock or pygame.time.Clock()
+        # 배속 재생은 프레임마다 돌릴 수 있는 스텝 수 상한도 배속만큼 늘립니다.
+        stepper = FixedStepAccumulator(replay["physics_hz"], max_steps=max(MAX_PHYSICS_STEPS_PER_FRAME, int(speed or 0)))
+        frame_dt, finished = 0.0, False
+        while not finished:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE): finished = True
+            if speed: steps = stepper.advance(frame_dt * speed)
+            else: steps, deadline = None, time.perf_counter() + 1.0 / RENDER_FPS
+            while not finished and (steps is None or steps > 0):
+                inputs = next(inputs_iter, None)
+                if inputs is None: finished = True; break
+                events = sim.step(step_dt, inputs)
+                if on_step: on_step(sim, events)
+                if steps is None:
+                    if time.perf_counter() >= deadline: break
+                else: steps -= 1
+            render_manager.render_play_scene(sim, stepper.alpha if speed else 1.0)
+            label = f"REPLAY {'max' if not speed else f'x{speed:g}'}  step {sim.step_count}/{replay['steps']}"
+            render_manager.ui_manager.draw_centered_text(label, render_manager.fonts['button_small'], WHITE, (settings.WIDTH / 2, scale_y(20)))
+            pygame.display.flip(); frame_dt = clock.tick(RENDER_FPS) / 1000
+
+    return sim, replay_outcome(sim) == replay["result"]
+
+# ======================================================================================
+# CLI
+# ======================================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Animal Bridge 리플레이 재생기")
+    parser.add_argument("path", help="리플레이 JSON 파일")
+    parser.add_argument("--speed", default="max", help="재생 배속: 1, 8 또는 max (기본: max)")
+    parser.add_argument("--render", action="store_true", help="창을 띄워 재생 화면을 그립니다")
+    args = parser.parse_args(argv)
+    speed = None if args.speed == "max" else float(args.speed)
+
+    replay = load_replay(args.path)
+    apply_replay_resolution(replay)
+    print(f"✓ 기록된 해상도로 재생: {settings.WIDTH}x{settings.HEIGHT}")
+    for warning in check_replay_environment(replay): print(f"⚠️ 기록 환경과 다름: {warning}")
+
+    render_manager = None
+    if args.render:
+        from render_manager import RenderManager
+        pygame.init()
+        screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+        pygame.display.set_caption(f"Animal Bridge - Replay (Stage {replay['stage']})")
+        render_manager = RenderManager(screen)
+
+    started = time.perf_counter()
+    sim, matched = play_replay(replay, speed, render_manager)
+    elapsed = time.perf_counter() - started
+    print(f"스테이지 {replay['stage']}: {sim.step_count}스텝 재생, {elapsed:.2f}초 (시뮬레이션 {sim.elapsed:.2f}초)")
+    print(f"{'✓ 기록된 결과와 일치' if matched else '✗ 기록된 결과와 다름'}: {replay_outcome(sim)} (기록: {replay['result']})")
+    if args.render: pygame.quit()
+    return 0 if matched else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
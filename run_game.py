@@ -27,8 +27,18 @@ except ImportError:
 # 필요한 파일들 확인
 required_files = [
     "game_core.py",
+    "game_objects.py",
+    "stage_simulation.py",
+    "compiled_stage.py",
+    "replay.py",
     "settings.py", 
     "render_manager.py",
+    "sprite_cache.py",
+    "asset_cache.py",
+    "preloader.py",
+    "asset_pack.py",
+    "texture_atlas.py",
+    "frame_profiler.py",
     "ui_manager.py",
     "audio_manager.py",
     "tilemap_renderer.py",
@@ -1,9 +1,11 @@
 # settings.py (전체 코드)
 
 import pygame
+import io
 import json
 import os
 import sys
+import time
 
 # ======================================================================================
 # ## 리소스 경로 함수 (가장 중요!) ##
@@ -23,6 +25,14 @@ WIDTH, HEIGHT = 1280, 720
 BASE_WIDTH, BASE_HEIGHT = 1280, 720
 FPS = 60
 
+# --- 물리 고정 스텝 (렌더링 빈도와 분리) ---
+PHYSICS_HZ = 60                   # 게임 로직과 입력이 진행되는 고정 스텝 빈도
+PHYSICS_SUBSTEPS = 5              # 한 스텝을 pymunk에서 나눠 계산하는 횟수
+MAX_PHYSICS_STEPS_PER_FRAME = 8   # 느린 프레임에서 따라잡을 최대 스텝 수 (초과분은 버림)
+RENDER_FPS = FPS                  # 게임 플레이 화면의 렌더링 상한 (고주사율 모니터면 올려도 됨)
+COYOTE_STEPS = max(1, round(0.08 * PHYSICS_HZ))       # 발판을 벗어난 뒤에도 점프를 허용하는 스텝 수 (약 80ms)
+JUMP_BUFFER_STEPS = max(1, round(0.1 * PHYSICS_HZ))   # 착지 직전 점프 입력을 기억해 두는 스텝 수 (약 100ms)
+
 # --- 타일 크기 관련 상수 ---
 BASE_TILE_SIZE = 36
 
@@ -52,6 +62,16 @@ def update_tile_size():
     global TILE_SIZE
     TILE_SIZE = get_current_tile_size()
 
+def set_resolution(width, height):
+    """실행 중에 해상도를 바꿉니다. scale_x/scale_y/scale_font와 타일 크기가 새 해상도를 따릅니다.
+
+    `from settings import *`로 가져간 WIDTH/HEIGHT는 바뀌지 않으므로 실행 중 해상도가 필요한 곳은
+    settings.WIDTH/settings.HEIGHT를 읽어야 합니다.
+    """
+    global WIDTH, HEIGHT
+    WIDTH, HEIGHT = width, height
+    update_tile_size()
+
 # --- 크기 및 위치 조절을 위한 헬퍼 함수 ---
 def scale_x(value):
     return int(value * (WIDTH / BASE_WIDTH))
@@ -87,6 +107,8 @@ CEILING_CATEGORY = 0b1000
 # === 추가: 충돌 타입 정의 ===
 PLAYER_COLLISION_TYPE = 1
 CARNIVORE_HEAD_COLLISION_TYPE = 2
+ANIMAL_COLLISION_TYPE = 3
+HAZARD_COLLISION_TYPE = 4
 # ============================
 
 # --- 육식동물 리스트 ---
@@ -174,35 +196,138 @@ STAGE_DATA = {
 # ======================================================================================
 FONT_PATH = "assets/Font/PF스타더스트 3.0 Bold.ttf"
 
+# 이름별 글꼴: 기준 해상도(1280x720)에서의 크기와 스타일 (크기, bold, italic)
+FONT_SPECS = {
+    'title_large': (90, True, False),
+    'title_medium': (70, True, False),
+    'title_small': (60, True, False),
+    'button_large': (60, False, False),
+    'button_medium': (50, False, False),
+    'button_small': (40, False, False),
+    'body_large': (50, False, False),
+    'body_medium': (35, False, False),
+    'body_small': (30, False, False),
+    'input': (50, False, False),
+    'placeholder': (30, False, True),
+    'timer': (40, False, False),
+    'count': (25, False, False),
+    'header': (45, True, False),
+}
+
+class FontRegistry:
+    """(경로, 배율을 적용한 크기, 스타일)별로 pygame Font를 한 번만 만들어 프로세스 전체에서 공유합니다.
+
+    폰트 파일은 한 번만 읽어 메모리에 두고, 크기마다 처음 쓸 때 Font를 만들며 걸린 시간을 기록합니다.
+    커스텀 TTF에는 bold/italic을 적용하지 않으므로(기존 동작) 같은 크기면 스타일이 달라도 한 Font를 씁니다.
+    스타일은 시스템 폰트로 대체할 때만 적용되고 키에 들어갑니다.
+    Font마다 마지막으로 쓰인 해상도를 기억해 두고, 해상도가 바뀌면 evict_stale()로 이전 해상도에서만 쓰던 것을 버립니다.
+    """
+
+    def __init__(self):
+        self.fonts = {}          # (경로 또는 시스템 폰트 이름, 크기, bold, italic) -> Font
+        self.load_times = {}     # 같은 키 -> Font를 만드는 데 걸린 초
+        self.used_at = {}        # 같은 키 -> 마지막으로 쓰인 해상도 (WIDTH, HEIGHT)
+        self.file_data = {}      # 경로 -> 폰트 파일 내용 (해상도가 바뀌어도 파일을 다시 읽지 않도록 보관)
+        self.failed_paths = set()
+        self.hits = 0
+
+    def font(self, size, bold=False, italic=False, path=FONT_PATH):
+        """기준 해상도의 size를 현재 해상도에 맞춘 폰트. 읽기에 실패하면 시스템 폰트로 대체합니다."""
+        scaled = scale_font(size)
+        if path not in self.failed_paths:
+            key = (path, scaled, False, False)
+            font = self.fonts.get(key)
+            if font is not None:
+                self.hits += 1
+                self.used_at[key] = (WIDTH, HEIGHT)
+                return font
+            try:
+                if path not in self.file_data: self.file_data[path] = self._read_font_file(path)
+                return self._create(key, pygame.font.Font, io.BytesIO(self.file_data[path]), scaled)
+            except (pygame.error, OSError):
+                print(f"⚠️ 커스텀 폰트 로드 실패, 시스템 폰트로 대체: {path}")
+                self.failed_paths.add(path)
+        return self.sysfont("malgungothic", scaled, bold, italic)
+
+    def _read_font_file(self, path):
+        """폰트 파일 내용. 에셋 팩에 들어 있으면 팩에서 꺼냅니다."""
+        from asset_pack import get_asset_pack   # asset_pack이 settings를 가져오므로 여기서 가져옵니다.
+        pack = get_asset_pack()
+        packed = pack.file_data(path) if pack is not None else None
+        if packed is not None: return bytes(packed)
+        with open(resource_path(path), 'rb') as f: return f.read()
+
+    def sysfont(self, name, size, bold=False, italic=False):
+        """pygame.font.SysFont와 같지만 (이름, 크기, 스타일)마다 한 번만 만듭니다. size는 배율을 적용한 값입니다."""
+        key = (name, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            self.used_at[key] = (WIDTH, HEIGHT)
+            return font
+        return self._create(key, pygame.font.SysFont, name, size, bold=bold, italic=italic)
+
+    def _create(self, key, factory, *args, **kwargs):
+        started = time.perf_counter()
+        font = self.fonts[key] = factory(*args, **kwargs)
+        self.load_times[key] = time.perf_counter() - started
+        self.used_at[key] = (WIDTH, HEIGHT)
+        return font
+
+    def evict_stale(self):
+        """현재 해상도에서 아직 쓰이지 않은 Font를 버리고 버린 개수를 반환합니다. 폰트 파일 내용은 남겨 둡니다.
+
+        새 해상도에서도 같은 크기로 쓰이는 Font는 그때 다시 현재 해상도로 기록되므로 남습니다.
+        """
+        stale = [key for key, resolution in self.used_at.items() if resolution != (WIDTH, HEIGHT)]
+        for key in stale:
+            del self.fonts[key], self.load_times[key], self.used_at[key]
+        return len(stale)
+
+    def stats(self):
+        return {"fonts": len(self.fonts), "hits": self.hits, "load_ms": sum(self.load_times.values()) * 1000}
+
+    def load_report(self):
+        """[(키, ms), ...]를 오래 걸린 순서로 반환합니다."""
+        return sorted(((key, seconds * 1000) for key, seconds in self.load_times.items()), key=lambda item: -item[1])
+
+# 전역 폰트 레지스트리 인스턴스
+font_registry = FontRegistry()
+
 def load_font(size, bold=False, italic=False):
-    """게임용 폰트를 로드합니다. 실패 시 시스템 폰트로 대체합니다."""
-    try:
-        return pygame.font.Font(resource_path(FONT_PATH), scale_font(size))
-    except (pygame.error, FileNotFoundError):
-        print(f"⚠️ 커스텀 폰트 로드 실패, 시스템 폰트로 대체: {FONT_PATH}")
-        return pygame.font.SysFont("malgungothic", scale_font(size), bold=bold, italic=italic)
-
-class GameFonts:
-    @staticmethod
-    def get_fonts():
-        return {
-            'title_large': load_font(90, bold=True),
-            'title_medium': load_font(70, bold=True),
-            'title_small': load_font(60, bold=True),
-            'button_large': load_font(60),
-            'button_medium': load_font(50),
-            'button_small': load_font(40),
-            'body_large': load_font(50),
-            'body_medium': load_font(35),
-            'body_small': load_font(30),
-            'input': load_font(50),
-            'placeholder': load_font(30, italic=True),
-            'timer': load_font(40),
-            'count': load_font(25),
-            'header': load_font(45, bold=True),
-        }
+    """게임용 폰트를 돌려줍니다. 실패 시 시스템 폰트로 대체합니다."""
+    return font_registry.font(size, bold, italic)
+
+class GameFonts(dict):
+    """FONT_SPECS의 이름으로 꺼내 쓰는 폰트 딕셔너리. 처음 꺼낼 때 font_registry에서 가져옵니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.scaled_sizes = {}   # 이름 -> 가져올 때의 배율 적용 크기
+
+    def __missing__(self, name):
+        size, bold, italic = FONT_SPECS[name]
+        font = self[name] = font_registry.font(size, bold, italic)
+        self.scaled_sizes[name] = scale_font(size)
+        return font
+
+    def refresh(self):
+        """해상도가 바뀌어 배율을 적용한 크기가 달라진 이름만 버립니다. 다음에 꺼낼 때 새 크기로 가져옵니다.
+
+        남는 이름의 폰트는 현재 해상도에서 쓰인 것으로 기록하고, 레지스트리에서 이전 해상도에만 쓰던 Font는 버립니다.
+        """
+        for name in [name for name in self if self.scaled_sizes[name] != scale_font(FONT_SPECS[name][0])]:
+            del self[name]
+        for name in self:
+            size, bold, italic = FONT_SPECS[name]
+            font_registry.font(size, bold, italic)
+        font_registry.evict_stale()
+
+# 전역 이름별 폰트 (Game과 RenderManager가 함께 씁니다)
+game_fonts = GameFonts()
 
 def init_fonts():
-    """pygame 초기화 후 호출해야 합니다."""
+    """pygame 초기화 후 호출해야 합니다. 모든 호출이 같은 game_fonts를 돌려줍니다."""
     pygame.font.init()
-    return GameFonts.get_fonts()
\ No newline at end of file
+    game_fonts.refresh()
+    return game_fonts
\ No newline at end of file
@@ -0,0 +1,140 @@
+# sprite_cache.py
+
+import pygame
+from collections import OrderedDict
+
+# ======================================================================================
+# 회전 스프라이트 캐시 (동물 블록 이미지를 각도 구간별로 한 번만 회전)
+# ======================================================================================
+ROTATION_STEP_DEGREES = 2                 # 회전 각도를 이 간격의 구간으로 묶습니다.
+ROTATION_CACHE_MAX_BYTES = 48 * 1024 * 1024
+ROTATION_CACHE_MAX_PINNED_BYTES = 16 * 1024 * 1024   # 그중 내보내지 않는 네 방향 이미지가 쓸 수 있는 양
+
+class RotationCache:
+    """(동물, 이미지 크기, 각도 구간)별 회전 이미지를 보관하는 LRU 캐시입니다.
+
+    0/90/180/270도 이미지는 처음 요청될 때 네 장을 함께 만들어 두고 내보내지 않습니다.
+    메모리 상한(max_bytes)은 이 고정 이미지(pinned_bytes)와 나머지 구간(lru_bytes)을 합친 양에 적용되고,
+    넘으면 나머지 구간을 가장 오래 쓰지 않은 것부터 버립니다. 고정 이미지는 max_pinned_bytes까지만 만들고
+    그 뒤에 처음 보는 이미지는 네 방향도 다른 구간처럼 LRU에 넣으므로, LRU에는 항상
+    max_bytes - max_pinned_bytes 이상이 남습니다.
+    """
+
+    def __init__(self, step_degrees=ROTATION_STEP_DEGREES, max_bytes=ROTATION_CACHE_MAX_BYTES, max_pinned_bytes=ROTATION_CACHE_MAX_PINNED_BYTES):
+        self.step_degrees = step_degrees
+        self.bucket_count = round(360 / step_degrees)
+        self.max_bytes = max_bytes
+        self.max_pinned_bytes = min(max_pinned_bytes, max_bytes)
+        self.axis_variants = {}        # (이름, 크기) -> {0: surf, 90: surf, 180: surf, 270: surf}
+        self.entries = OrderedDict()   # (이름, 크기, 구간) -> surf
+        self.pinned_bytes = 0          # 내보내지 않는 네 방향 이미지
+        self.lru_bytes = 0             # 내보낼 수 있는 나머지 구간 이미지
+        self.hits = self.misses = 0
+
+    @property
+    def used_bytes(self):
+        return self.pinned_bytes + self.lru_bytes
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _precompute_axis_variants(self, key, image):
+        variants = {angle: pygame.transform.rotate(image, angle) for angle in (0, 90, 180, 270)}
+        self.pinned_bytes += sum(self._surface_bytes(surf) for surf in variants.values())
+        self.axis_variants[key] = variants
+        return variants
+
+    def rotated(self, name, image, angle_degrees, precompute_axes=True):
+        """pygame.transform.rotate(image, angle_degrees)와 같은 이미지를 각도 구간 단위로 돌려줍니다.
+
+        precompute_axes=False면 네 방향 이미지를 미리 만들지 않고 요청된 구간만 LRU에 넣습니다.
+        (죽는 애니메이션의 축소 프레임처럼 잠깐만 쓰이는 이미지용)
+        """
+        key = (name, image.get_size())
+        variants = self.axis_variants.get(key)
+        if variants is None and precompute_axes and self.pinned_bytes + 4 * self._surface_bytes(image) <= self.max_pinned_bytes:
+            variants = self._precompute_axis_variants(key, image)
+
+        bucket = round(angle_degrees / self.step_degrees) % self.bucket_count
+        bucket_angle = bucket * self.step_degrees
+        if variants is not None and bucket_angle % 90 == 0:
+            self.hits += 1
+            return variants[bucket_angle]
+
+        entry_key = key + (bucket,)
+        surface = self.entries.get(entry_key)
+        if surface is not None:
+            self.entries.move_to_end(entry_key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = pygame.transform.rotate(image, bucket_angle)
+        self.entries[entry_key] = surface
+        self.lru_bytes += self._surface_bytes(surface)
+        while self.used_bytes > self.max_bytes and self.entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.lru_bytes -= self._surface_bytes(evicted)
+        return surface
+
+    def clear(self):
+        """해상도 변경 등으로 이미지 크기가 바뀌면 캐시를 비웁니다."""
+        self.axis_variants.clear()
+        self.entries.clear()
+        self.pinned_bytes = self.lru_bytes = 0
+
+    def stats(self):
+        return {"entries": len(self.entries), "axis_sets": len(self.axis_variants), "bytes": self.used_bytes, "pinned_bytes": self.pinned_bytes, "hits": self.hits, "misses": self.misses}
+
+# ======================================================================================
+# 죽는 애니메이션 축소 프레임 캐시 (동물, 크기별로 한 번만 만들어 모든 블록이 공유)
+# ======================================================================================
+DEATH_SHRINK_FRAMES = 12                 # 죽는 애니메이션 동안 이미지를 줄여 나가는 단계 수
+
+class ShrinkFrameCache:
+    """(동물, 이미지 크기)별로 점점 작아지는 프레임 목록을 한 번만 만들어 둡니다.
+
+    첫 프레임은 원래 이미지 그대로이므로 살아 있을 때의 회전 캐시를 그대로 이어 씁니다.
+    나머지 프레임은 RotationCache.rotated(..., precompute_axes=False)로 필요한 각도만 회전합니다.
+    너무 작아져 크기가 0이 되는 프레임은 None입니다.
+    """
+
+    def __init__(self, frame_count=DEATH_SHRINK_FRAMES):
+        self.frame_count = frame_count
+        self.frames = {}               # (이름, 크기) -> [surf 또는 None, ...]
+        self.hits = self.misses = 0
+
+    def frames_for(self, name, image):
+        key = (name, image.get_size())
+        frames = self.frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        self.misses += 1
+        width, height = image.get_size()
+        frames = [image]
+        for index in range(1, self.frame_count):
+            progress = 1.0 - index / self.frame_count
+            size = (int(width * progress), int(height * progress))
+            frames.append(pygame.transform.scale(image, size) if size[0] > 0 and size[1] > 0 else None)
+        self.frames[key] = frames
+        return frames
+
+    def frame(self, name, image, elapsed, duration):
+        """죽기 시작한 뒤 elapsed만큼 지났을 때 그릴 축소 프레임을 돌려줍니다."""
+        index = min(self.frame_count - 1, int(elapsed / duration * self.frame_count))
+        return self.frames_for(name, image)[index]
+
+    def clear(self):
+        self.frames.clear()
+
+    def stats(self):
+        # 첫 프레임은 원래 이미지를 그대로 가리키므로 용량에서 뺍니다.
+        used_bytes = sum(RotationCache._surface_bytes(frame) for frames in self.frames.values() for frame in frames[1:] if frame is not None)
+        return {"sets": len(self.frames), "bytes": used_bytes, "hits": self.hits, "misses": self.misses}
+
+# 전역 캐시 인스턴스
+rotation_cache = RotationCache()
+shrink_frame_cache = ShrinkFrameCache()
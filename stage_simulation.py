@@ -0,0 +1,289 @@
+# stage_simulation.py
+
+import pygame
+import pymunk
+from settings import *
+from compiled_stage import get_compiled_stage
+from frame_profiler import profiler
+from game_objects import Player, AnimalBlock, Flag, setup_level, create_hazard_sensor, add_collision_callbacks, store_previous_transform, capture_body_state
+
+# ======================================================================================
+# 스테이지 시뮬레이션 (디스플레이 없이 동작하는 게임 규칙/물리 코어)
+# ======================================================================================
+class StageSimulation:
+    """한 스테이지의 물리 공간, 플레이어, 동물 블록과 포식/가시/골 판정을 소유합니다.
+
+    pygame 디스플레이나 시계에 의존하지 않고 step(dt, inputs) 호출로만 진행되므로
+    창 없이 실시간보다 훨씬 빠르게 돌릴 수 있습니다. step()은 이번 스텝에서 발생한
+    사운드 이벤트 이름 목록을 반환하며, 재생은 호출하는 쪽이 담당합니다.
+
+    inputs 딕셔너리 키:
+        "move": -1(왼쪽) / 0 / 1(오른쪽)
+        "jump": 점프 입력 여부
+        "drops": [(동물 이름, (x, y), 회전 각도), ...]
+    """
+
+    def __init__(self, stage_level, headless=False, substeps=PHYSICS_SUBSTEPS):
+        self.stage_level = stage_level
+        # 스테이지 좌표와 영역은 컴파일된 스테이지에서 그대로 가져옵니다 (해상도마다 한 번만 계산).
+        self.stage = stage = get_compiled_stage(stage_level)
+        self.available_animals = stage.available_animals
+        self.has_hazard_floor = stage.has_hazard_floor
+        self.headless = headless
+        self.substeps = substeps
+
+        self.space = pymunk.Space()
+        self.space.gravity = stage.gravity
+        setup_level(self.space, stage.static_body_specs)
+
+        self.player = Player(self.space, stage.player_spawn)
+        self.goal_flag = Flag(stage.goal_pos, stage.flag_pole_rect, stage.flag_cloth_points)
+        self.goal_area = stage.goal_rect
+        self.block_scale = stage.block_scale
+        self.hazard_y = stage.hazard_y
+        self.drop_zone = stage.drop_zone
+        self.move_speed = stage.move_speed
+
+        self.game_objects, self.to_be_eaten = [], []
+        self.blocks_by_body = {}
+        self.blocks_used_count, self.eaten_blocks_count = 0, 0
+        self.animal_usage_counts = {name: 1 for name in self.available_animals}
+        self.elapsed = 0.0
+        self.step_count = 0
+        self.is_cleared = False
+        self.clear_time = None
+
+        # 충돌 사운드: 충돌 충격량으로 판정하고 블록마다 쿨다운을 둡니다.
+        self.impact_speed_threshold = scale_y(100)  # 한 번의 충돌로 바뀐 속도(px/s) 기준
+        self.drop_sound_cooldown = 100  # 블록별 100ms 쿨다운
+        self.pending_events = []  # 물리 스텝 중 콜백에서 생긴 이벤트
+
+        add_collision_callbacks(self.space, CARNIVORE_HEAD_COLLISION_TYPE, ANIMAL_COLLISION_TYPE, begin=self._on_head_contact)
+        add_collision_callbacks(self.space, ANIMAL_COLLISION_TYPE, post_solve=self._on_animal_impact)
+
+        # 가시 바닥은 정적 센서로 두고, 닿는 순간(begin)에만 사망 처리합니다.
+        self.hazard_radius = scale_y(2)
+        self.hazard_victims, self.player_hit_hazard = [], False
+        if self.has_hazard_floor:
+            create_hazard_sensor(self.space, self.hazard_y, self.hazard_radius, self.stage.resolution[0])
+            add_collision_callbacks(self.space, HAZARD_COLLISION_TYPE, ANIMAL_COLLISION_TYPE, begin=self._on_hazard_animal)
+            add_collision_callbacks(self.space, HAZARD_COLLISION_TYPE, PLAYER_COLLISION_TYPE, begin=self._on_hazard_player)
+
+        # 처음 상태를 저장해 두면 다시 시작할 때 공간/지형/플레이어를 새로 만들지 않아도 됩니다.
+        self.initial_snapshot = self.snapshot()
+
+    @property
+    def elapsed_ms(self):
+        return self.elapsed * 1000
+
+    def can_drop(self, animal_name):
+        return self.animal_usage_counts.get(animal_name, 0) > 0
+
+    def drop_animal(self, animal_name, pos, angle_degrees=0):
+        """동물 블록을 설치합니다. 사용할 수 없는 동물이면 None을 반환합니다."""
+        if not self.can_drop(animal_name): return None
+        animal = AnimalBlock(self.space, pos, animal_name, self.block_scale, angle_degrees=angle_degrees, load_image=not self.headless)
+        self.game_objects.append(animal)
+        self.blocks_by_body[animal.body] = animal
+        self.blocks_used_count += 1
+        self.animal_usage_counts[animal_name] = 0
+        return animal
+
+    def snapshot(self):
+        """스텝과 스텝 사이의 상태를 저장합니다. 동물 블록 객체는 공유하고 바디 상태만 복사합니다."""
+        return {
+            "player": self.player.snapshot_state(),
+            "blocks": [(animal, capture_body_state(animal.body), animal.body.space is self.space, animal.is_dying, animal.death_elapsed, animal.last_impact_time)
+                       for animal in self.game_objects],
+            "to_be_eaten": list(self.to_be_eaten), "hazard_victims": list(self.hazard_victims), "player_hit_hazard": self.player_hit_hazard,
+            "blocks_used_count": self.blocks_used_count, "eaten_blocks_count": self.eaten_blocks_count,
+            "animal_usage_counts": dict(self.animal_usage_counts),
+            "elapsed": self.elapsed, "step_count": self.step_count, "is_cleared": self.is_cleared, "clear_time": self.clear_time,
+        }
+
+    def restore(self, snapshot):
+        """snapshot() 시점으로 되돌립니다. 플레이어와 동물 블록의 바디/도형을 새로 만들어 넣으므로
+        이전 접촉 정보나 바디에 남은 솔버 보정값이 없고, 새로 만든 시뮬레이션과 같은 결과로 이어집니다."""
+        for animal in self.game_objects: animal.remove_from_space(self.space)
+        self.game_objects, self.blocks_by_body = [], {}
+        for animal, body_state, in_space, is_dying, death_elapsed, last_impact_time in snapshot["blocks"]:
+            animal.rebuild_body(self.space, body_state)
+            animal.is_dying, animal.death_elapsed, animal.last_impact_time = is_dying, death_elapsed, last_impact_time
+            if in_space:
+                animal.add_to_space(self.space)
+                self.blocks_by_body[animal.body] = animal
+            store_previous_transform(animal)
+            self.game_objects.append(animal)
+        self.player.restore_state(self.space, snapshot["player"])
+
+        self.to_be_eaten, self.hazard_victims = list(snapshot["to_be_eaten"]), list(snapshot["hazard_victims"])
+        self.player_hit_hazard = snapshot["player_hit_hazard"]
+        self.pending_events = []
+        self.blocks_used_count, self.eaten_blocks_count = snapshot["blocks_used_count"], snapshot["eaten_blocks_count"]
+        self.animal_usage_counts = dict(snapshot["animal_usage_counts"])
+        self.elapsed, self.step_count = snapshot["elapsed"], snapshot["step_count"]
+        self.is_cleared, self.clear_time = snapshot["is_cleared"], snapshot["clear_time"]
+
+    def restart(self):
+        """스테이지를 처음 상태로 되돌립니다."""
+        self.restore(self.initial_snapshot)
+
+    def _kill_animal(self, animal):
+        animal.start_dying()
+        animal.remove_from_space(self.space)
+        self.blocks_by_body.pop(animal.body, None)
+
+    def _on_head_contact(self, arbiter, space, data):
+        """육식동물 머리 센서가 다른 동물 블록에 닿으면 먹이 대기열에 넣습니다."""
+        head_shape, prey_shape = arbiter.shapes
+        carnivore = self.blocks_by_body.get(head_shape.body)
+        prey = self.blocks_by_body.get(prey_shape.body)
+        if carnivore is None or prey is None or carnivore.is_dying or prey.is_dying: return
+        if prey.name in CARNIVORES or prey in self.to_be_eaten: return
+        self.to_be_eaten.append(prey)
+
+    def _on_hazard_animal(self, arbiter, space, data):
+        animal = self.blocks_by_body.get(arbiter.shapes[1].body)
+        if animal is not None and not animal.is_dying and animal not in self.hazard_victims:
+            self.hazard_victims.append(animal)
+
+    def _on_hazard_player(self, arbiter, space, data):
+        self.player_hit_hazard = True
+
+    def _on_animal_impact(self, arbiter, space, data):
+        """동물 블록이 받은 충격량이 크면 블록별 쿨다운을 지켜 'drop' 사운드를 냅니다.
+
+        post_solve는 쌓여 있는 블록의 접촉마다 서브스텝마다 불리므로, 처음 닿은 스텝이 아니면 바로 돌아갑니다.
+        """
+        if not arbiter.is_first_contact: return
+        animal = self.blocks_by_body.get(arbiter.shapes[0].body)
+        if animal is None or animal.is_dying: return
+        current_time = self.elapsed_ms
+        if current_time - animal.last_impact_time <= self.drop_sound_cooldown: return
+        if arbiter.total_impulse.length / animal.body.mass > self.impact_speed_threshold:
+            animal.last_impact_time = current_time
+            if 'drop' not in self.pending_events: self.pending_events.append('drop')
+
+    def step(self, dt, inputs=None):
+        """시뮬레이션을 dt초 진행하고 발생한 사운드 이벤트 목록을 반환합니다."""
+        events = []
+        if self.is_cleared: return events
+        inputs = inputs or {}
+
+        store_previous_transform(self.player)
+        for animal in self.game_objects: store_previous_transform(animal)
+
+        for animal_name, pos, angle_degrees in inputs.get("drops", ()):
+            if self.drop_animal(animal_name, pos, angle_degrees): events.append('place')
+        if inputs.get("jump"): self.player.buffer_jump()
+
+        self.player.update(self.space, dt)
+        if self.player.jump(): events.append('jump')
+        self.player.set_horizontal_velocity(inputs.get("move", 0) * self.move_speed)
+
+        player_death_y = self.hazard_y if self.has_hazard_floor else self.stage.resolution[1] + scale_y(50)
+        if self.player_hit_hazard or self.player.body.position.y > player_death_y:
+            self.player_hit_hazard = False
+            self.player.respawn(); events.append('error')
+
+        for animal in self.hazard_victims:
+            if not animal.is_dying:
+                self._kill_animal(animal)
+                events.append('destroy')
+        self.hazard_victims.clear()
+
+        # 센서를 놓치는 경우(화면 밖으로 떨어짐, 한 서브스텝에 센서를 건너뛸 만큼 빠른 낙하)만
+        # 값싼 위치/경계 상자 검사로 보완합니다. 멈춰 있는 블록은 검사하지 않습니다.
+        tunnel_speed = self.hazard_radius * 2 * self.substeps / dt
+        for animal in self.game_objects:
+            if animal.is_dying: continue
+            should_die = animal.body.position.y > self.stage.resolution[1] + scale_y(100)
+            if not should_die and self.has_hazard_floor and animal.body.velocity.y > tunnel_speed:
+                should_die = any(shape.bb.top > self.hazard_y for shape in animal.shapes)
+            if should_die:
+                self._kill_animal(animal)
+                events.append('destroy')
+
+        self.game_objects = [a for a in self.game_objects if not (a.is_dying and a.death_elapsed > a.death_duration)]
+        # 가시 바닥 등으로 이미 죽은 먹이는 대기열에서 제외합니다.
+        self.to_be_eaten = [a for a in self.to_be_eaten if not a.is_dying]
+        if self.to_be_eaten:
+            self.eaten_blocks_count += len(self.to_be_eaten)
+            events.append('bite')  # bite 사운드는 한 번만
+            for animal in self.to_be_eaten:
+                self._kill_animal(animal)
+            self.to_be_eaten.clear()
+
+        if self.goal_area.collidepoint(self.player.body.position):
+            self.is_cleared = True
+            self.clear_time = self.elapsed
+            events.append('victory')
+            return events
+
+        profiler.mark("checks")
+        sub_dt = dt / self.substeps
+        for _ in range(self.substeps): self.space.step(sub_dt)
+        profiler.mark("physics")
+        if self.pending_events:
+            events.extend(self.pending_events)
+            self.pending_events.clear()
+        self.elapsed += dt
+        self.step_count += 1
+        for animal in self.game_objects:
+            if animal.is_dying: animal.death_elapsed += dt * 1000
+        return events
+
+    def result(self):
+        """랭킹 정렬 기준과 같은 순서의 결과 정보를 반환합니다."""
+        return {"stage": self.stage_level, "blocks": self.blocks_used_count, "eaten": self.eaten_blocks_count, "time": self.clear_time if self.is_cleared else self.elapsed}
+
+# ======================================================================================
+# 스테이지별 시뮬레이션 캐시 (같은 스테이지에 다시 들어가거나 재시작할 때 재사용)
+# ======================================================================================
+_stage_simulations = {}
+
+def get_stage_simulation(stage_level):
+    """스테이지의 시뮬레이션을 처음 상태로 되돌려 반환합니다. 처음 한 번만 새로 만듭니다."""
+    sim = _stage_simulations.get(stage_level)
+    if sim is None:
+        sim = _stage_simulations[stage_level] = StageSimulation(stage_level)
+    else:
+        sim.restart()
+    return sim
+
+def clear_stage_simulations():
+    """해상도가 바뀌는 등 좌표 기준이 달라지면 저장된 시뮬레이션을 버립니다."""
+    _stage_simulations.clear()
+
+# ======================================================================================
+# 고정 스텝 누산기 (렌더링 빈도와 물리 빈도 분리)
+# ======================================================================================
+class FixedStepAccumulator:
+    """실제 경과 시간을 모아 고정 크기(1/PHYSICS_HZ)의 시뮬레이션 스텝 수로 바꿔 줍니다.
+
+    한 프레임에 돌릴 스텝 수는 max_steps로 제한하고 넘치는 시간은 버려서, 느린
+    프레임이 쌓여도 따라잡기 폭주가 생기지 않습니다. alpha는 남은 시간 비율로,
+    이전/현재 스텝 사이 보간 렌더링에 씁니다.
+    """
+
+    def __init__(self, physics_hz=PHYSICS_HZ, max_steps=MAX_PHYSICS_STEPS_PER_FRAME):
+        self.step_dt = 1.0 / physics_hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt):
+        """frame_dt초가 흘렀을 때 이번 프레임에 돌릴 스텝 수를 반환합니다."""
+        self.accumulator += frame_dt
+        steps = min(int(self.accumulator / self.step_dt), self.max_steps)
+        self.accumulator -= steps * self.step_dt
+        if steps == self.max_steps:
+            self.accumulator = min(self.accumulator, self.step_dt)
+        return steps
+
+    def reset(self):
+        """모인 시간을 버립니다. 모달 화면처럼 시뮬레이션이 멈춰 있던 뒤에 부릅니다."""
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.step_dt)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# stage_solver.py - 스테이지 자동 풀이 도구
+#
+# STAGE_DATA의 각 스테이지에 대해 블록 배치(동물, 설치 x/y, 90° 회전, 설치 순서)를 탐색하고,
+# 후보마다 StageSimulation을 창 없이 돌려 클리어 여부를 확인합니다.
+# 후보 시뮬레이션은 ProcessPoolExecutor로 모든 코어에 나눠 실행합니다.
+#
+# 사용 예:
+#   python stage_solver.py                 # 전체 스테이지
+#   python stage_solver.py 3 7-10 --beam 12 --x-step 40 --json solutions.json
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import pymunk
+from settings import *
+from stage_simulation import StageSimulation
+
+# ======================================================================================
+# 후보 하나 시뮬레이션 (워커 프로세스에서 실행)
+# ======================================================================================
+SETTLE_SECONDS = 1.5    # 블록 하나를 놓은 뒤 다음 블록(또는 출발)까지 기다리는 시간
+RUN_SECONDS = 20.0      # 마지막 블록이 자리 잡은 뒤 플레이어가 골까지 가는 제한 시간
+MAX_RESPAWNS = 2        # 이 횟수만큼 떨어지면 실패로 보고 일찍 끝냄
+
+def scripted_player_input(sim, state):
+    """오른쪽으로 걸어가다가 앞이 비었거나 막혀 있으면 점프하는 단순한 플레이어 정책."""
+    player = sim.player
+    x, y = player.body.position
+    probe_x = x + scale_x(45)
+    probe_filter = pymunk.ShapeFilter(mask=TERRAIN_CATEGORY | ANIMAL_CATEGORY)
+    ground_ahead = sim.space.segment_query_first((probe_x, y), (probe_x, y + scale_y(120)), 1, probe_filter)
+    stuck = x - state["last_x"] < scale_x(0.5)
+    state["stuck_steps"] = state["stuck_steps"] + 1 if stuck else 0
+    state["last_x"] = x
+    jump = player.is_grounded and (ground_ahead is None or state["stuck_steps"] > 6)
+    return {"move": 1, "jump": jump, "drops": []}
+
+def simulate_candidate(stage_level, placements, dt=1.0 / PHYSICS_HZ):
+    """placements = ((동물, x, y, 각도), ...)를 순서대로 설치한 뒤 정책대로 플레이해 결과를 반환합니다."""
+    sim = StageSimulation(stage_level, headless=True)
+    settle_steps = int(SETTLE_SECONDS / dt)
+    for name, x, y, angle_degrees in placements:
+        sim.step(dt, {"drops": [(name, (x, y), angle_degrees)]})
+        for _ in range(settle_steps - 1): sim.step(dt)
+
+    state = {"last_x": sim.player.body.position.x, "stuck_steps": 0}
+    best_x, respawns = state["last_x"], 0
+    for _ in range(int(RUN_SECONDS / dt)):
+        events = sim.step(dt, scripted_player_input(sim, state))
+        if sim.is_cleared: break
+        if 'error' in events:
+            respawns += 1
+            if respawns >= MAX_RESPAWNS: break
+        best_x = max(best_x, sim.player.body.position.x)
+
+    result = sim.result()
+    return {"placements": list(placements), "cleared": sim.is_cleared, "progress": best_x,
+            "blocks": result["blocks"], "eaten": result["eaten"], "time": result["time"]}
+
+def _simulate_job(job):
+    return simulate_candidate(*job)
+
+# ======================================================================================
+# 탐색 (빔 서치: 블록 수를 하나씩 늘리며 가장 멀리 간 부분 배치만 이어서 확장)
+# ======================================================================================
+def ranking_key(solution):
+    """랭킹 정렬 기준(blocks, eaten, time)과 같은 순서의 키."""
+    return (solution["blocks"], solution["eaten"], solution["time"])
+
+def placement_grid(sim, x_step, y_values, angles):
+    zone = sim.drop_zone
+    xs = range(int(zone.left + x_step / 2), int(zone.right), int(x_step))
+    ys = [zone.top + zone.height * v for v in y_values]
+    return [(x, y, a) for x in xs for y in ys for a in angles]
+
+def solve_stage(executor, stage_level, max_blocks, beam, x_step, y_values, angles, chunksize):
+    probe = StageSimulation(stage_level, headless=True)
+    animals = list(probe.available_animals)
+    grid = placement_grid(probe, x_step, y_values, angles)
+    max_blocks = len(animals) if max_blocks is None else min(max_blocks, len(animals))
+
+    frontier, evaluated = [()], 0
+    for block_count in range(max_blocks + 1):
+        if block_count == 0:
+            candidates = [()]
+        else:
+            candidates = []
+            for partial in frontier:
+                used = {p[0] for p in partial}
+                for name in animals:
+                    if name in used: continue
+                    candidates.extend(partial + ((name, x, y, a),) for x, y, a in grid)
+        if not candidates: break
+
+        results = list(executor.map(_simulate_job, [(stage_level, c) for c in candidates], chunksize=chunksize))
+        evaluated += len(results)
+        solutions = sorted((r for r in results if r["cleared"]), key=ranking_key)
+        if solutions:
+            return {"stage": stage_level, "solved": True, "min_blocks": block_count, "solutions": solutions, "evaluated": evaluated}
+
+        results.sort(key=lambda r: (-r["progress"], r["time"]))
+        frontier = [tuple(tuple(p) for p in r["placements"]) for r in results[:beam]]
+    return {"stage": stage_level, "solved": False, "min_blocks": None, "solutions": [], "evaluated": evaluated}
+
+# ======================================================================================
+# CLI
+# ======================================================================================
+def parse_stage_list(tokens):
+    stages = []
+    for token in tokens:
+        if '-' in token:
+            start, end = token.split('-', 1)
+            stages.extend(range(int(start), int(end) + 1))
+        else:
+            stages.append(int(token))
+    return stages
+
+def format_placement(placement):
+    name, x, y, angle_degrees = placement
+    return f"{name}@({x:.0f},{y:.0f}) {angle_degrees}°"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Animal Bridge 스테이지 자동 풀이기")
+    parser.add_argument("stages", nargs="*", help="풀 스테이지 번호 (예: 1 3 5-8). 생략하면 전체")
+    parser.add_argument("--max-blocks", type=int, default=None, help="탐색할 최대 블록 수 (기본: 스테이지의 동물 수)")
+    parser.add_argument("--beam", type=int, default=8, help="블록 수마다 이어서 확장할 부분 배치 수")
+    parser.add_argument("--x-step", type=float, default=60, help="설치 x 좌표 간격(px)")
+    parser.add_argument("--y", type=float, nargs="+", default=[0.5], help="설치 영역 높이 대비 y 위치 비율 목록")
+    parser.add_argument("--angles", type=int, nargs="+", default=[0, 90, 180, 270], help="시도할 회전 각도 목록")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="워커 프로세스 수")
+    parser.add_argument("--top", type=int, default=3, help="스테이지마다 출력할 최소 블록 풀이 수")
+    parser.add_argument("--json", dest="json_path", help="전체 결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    stages = parse_stage_list(args.stages) if args.stages else sorted(int(k) for k in STAGE_DATA)
+    reports = []
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for stage_level in stages:
+            if str(stage_level) not in STAGE_DATA:
+                print(f"✗ 스테이지 {stage_level}: STAGE_DATA에 없습니다.")
+                continue
+            started = time.perf_counter()
+            report = solve_stage(executor, stage_level, args.max_blocks, args.beam, args.x_step, args.y, args.angles, chunksize=16)
+            report["seconds"] = time.perf_counter() - started
+            reports.append(report)
+
+            if report["solved"]:
+                best = report["solutions"][0]
+                print(f"✓ 스테이지 {stage_level}: 최소 {report['min_blocks']}블록, 최고 기록 (blocks={best['blocks']}, eaten={best['eaten']}, time={best['time']:.2f}s)"
+                      f" - 후보 {report['evaluated']}개, {report['seconds']:.1f}초")
+                for solution in report["solutions"][:args.top]:
+                    print("    " + (" → ".join(format_placement(p) for p in solution["placements"]) or "(블록 없이 통과)"))
+            else:
+                print(f"✗ 스테이지 {stage_level}: 풀이를 찾지 못했습니다 - 후보 {report['evaluated']}개, {report['seconds']:.1f}초")
+
+    unsolved = [r["stage"] for r in reports if not r["solved"]]
+    print(f"\n풀리지 않은 스테이지: {unsolved if unsolved else '없음'}")
+
+    if args.json_path:
+        for report in reports: report["solutions"] = report["solutions"][:args.top]
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, ensure_ascii=False, indent=4)
+        print(f"결과 저장: {args.json_path}")
+    return 1 if unsolved else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,13 @@
+# conftest.py - 테스트 공통 설정
+#
+# 게임 모듈은 저장소 최상위에 있고 에셋 경로를 현재 폴더 기준으로 찾으므로,
+# 저장소 폴더를 import 경로와 작업 폴더로 잡고 창/소리 없이 pygame을 씁니다.
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+if ROOT not in sys.path: sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,66 @@
+# test_asset_cache.py - AssetCache가 같은 경로라도 alpha 여부별로 다른 이미지를 돌려주는지 확인합니다.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+import pytest
+from asset_cache import AssetCache
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.display.quit()
+
+@pytest.fixture
+def image_path(tmp_path):
+    surface = pygame.Surface((8, 8), pygame.SRCALPHA)
+    surface.fill((255, 0, 0, 128))
+    path = str(tmp_path / "half.png")
+    pygame.image.save(surface, path)
+    return path
+
+def has_alpha(surface):
+    return bool(surface.get_flags() & pygame.SRCALPHA)
+
+def test_alpha_and_opaque_are_cached_separately(image_path):
+    cache = AssetCache()
+    opaque = cache.image(image_path, alpha=False)
+    translucent = cache.image(image_path, alpha=True)
+    assert not has_alpha(opaque)
+    assert has_alpha(translucent)
+    assert translucent.get_at((0, 0)).a == 128
+    assert cache.image(image_path, alpha=False) is opaque
+    assert cache.image(image_path) is translucent
+    assert cache.loads == 2
+
+def test_preload_keeps_requested_alpha(image_path, monkeypatch):
+    decoded = []
+    load = pygame.image.load
+    monkeypatch.setattr(pygame.image, "load", lambda *args: decoded.append(args[0]) or load(*args))
+    cache = AssetCache()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures = [cache.preload(executor, image_path, alpha=False), cache.preload(executor, image_path, alpha=True)]
+        assert None not in futures and futures[0] is not futures[1]   # 다른 형식이므로 따로 맡김
+        assert cache.preload(executor, image_path, alpha=True) is futures[1]   # 같은 형식은 다시 맡기지 않음
+        for future in futures: future.result()
+    assert cache.finish_preloads() == 0          # 남은 작업 없음
+    assert cache.loads == 2 and not cache.pending
+    assert len(decoded) == 2
+
+    translucent, opaque = cache.image(image_path), cache.image(image_path, alpha=False)
+    assert has_alpha(translucent) and not has_alpha(opaque)
+    assert translucent is cache.originals[(image_path, True)]
+    assert len(decoded) == 2 and cache.loads == 2   # 미리 읽은 Surface를 그대로 돌려주고 파일을 다시 읽지 않음
+
+def test_failure_is_remembered_per_alpha(tmp_path):
+    """한 형식으로 읽다 실패한 기록이 다른 형식 요청을 막지 않습니다."""
+    cache = AssetCache()
+    path = str(tmp_path / "late.png")
+    with pytest.raises((pygame.error, OSError)):
+        cache.image(path, alpha=False)
+    pygame.image.save(pygame.Surface((4, 4), pygame.SRCALPHA), path)
+    assert has_alpha(cache.image(path))
+    with pytest.raises((pygame.error, OSError)):
+        cache.image(path, alpha=False)   # 실패한 형식은 다시 파일을 찾지 않음
@@ -0,0 +1,64 @@
+# test_asset_pack.py - PackWriter로 쓴 항목을 AssetPack이 같은 바이트로 읽어 오는지 확인합니다.
+
+import pygame
+import pytest
+from asset_pack import PackWriter, AssetPack, PACK_ALIGN, pack_key
+
+@pytest.fixture
+def sample_surface():
+    surface = pygame.Surface((5, 3), pygame.SRCALPHA)
+    for x in range(5):
+        for y in range(3):
+            surface.set_at((x, y), (x * 50, y * 80, 7, 40 + x * 40))
+    return surface
+
+def write_pack(path, build):
+    with open(path, 'wb') as f:
+        writer = PackWriter(f)
+        build(writer)
+        writer.finish(version=1, sources=["assets/a.png"])
+    return writer
+
+def test_data_round_trip_and_dedupe(tmp_path):
+    payloads = {"data:one": b"hello", "data:two": bytes(range(256)) * 3, "data:empty": b""}
+    def build(writer):
+        for name, payload in payloads.items(): writer.add(name, payload, kind="data")
+        writer.add("data:copy", payloads["data:two"], kind="data")
+    writer = write_pack(tmp_path / "test.pack", build)
+
+    pack = AssetPack(str(tmp_path / "test.pack"))
+    for name, payload in payloads.items():
+        assert bytes(pack.data(name)) == payload
+    assert bytes(pack.data("data:copy")) == payloads["data:two"]
+    assert pack.entries["data:copy"]["offset"] == pack.entries["data:two"]["offset"]   # 같은 내용은 한 번만 씀
+    assert len(writer.blocks) == len(payloads)
+    assert all(entry["offset"] % PACK_ALIGN == 0 for entry in pack.entries.values())
+    assert pack.sources() == ["assets/a.png"]
+
+@pytest.mark.parametrize("alpha", [True, False])
+def test_surface_round_trip(tmp_path, sample_surface, alpha):
+    write_pack(tmp_path / "test.pack", lambda writer: writer.add_surface("image:assets/a.png", sample_surface, alpha=alpha))
+    pack = AssetPack(str(tmp_path / "test.pack"))
+    assert pack.has_image("assets/a.png")
+    image = pack.load_image("assets/a.png")
+    pixel_format = "RGBA" if alpha else "RGB"
+    assert image.get_size() == sample_surface.get_size()
+    assert pygame.image.tobytes(image, pixel_format) == pygame.image.tobytes(sample_surface, pixel_format)
+
+def test_atlas_regions_round_trip(tmp_path, sample_surface):
+    regions = {"assets/img/a.png": pygame.Rect(0, 0, 2, 3), "assets/img/b.png": pygame.Rect(3, 1, 2, 2)}
+    write_pack(tmp_path / "test.pack", lambda writer: writer.add_surface("atlas:animals", sample_surface, regions={name: list(rect) for name, rect in regions.items()}))
+    pack = AssetPack(str(tmp_path / "test.pack"))
+    image, loaded = pack.load_atlas("animals")
+    assert pack.atlas_names() == ["animals"]
+    assert loaded == regions
+    for rect in regions.values():
+        assert image.subsurface(rect).get_at((0, 0)) == sample_surface.subsurface(rect).get_at((0, 0))
+
+def test_rejects_unknown_file(tmp_path):
+    (tmp_path / "bad.pack").write_bytes(b"NOTAPACK" + b"\x00" * 64)
+    with pytest.raises(ValueError):
+        AssetPack(str(tmp_path / "bad.pack"))
+
+def test_pack_key_normalizes_separators():
+    assert pack_key("assets/bg/../bg/background.png") == "assets/bg/background.png"
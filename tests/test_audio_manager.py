@@ -0,0 +1,13 @@
+# test_audio_manager.py - 없는 사운드 파일을 재생하려 할 때 한 번만 알리는지 확인합니다.
+
+from audio_manager import AudioManager
+
+def test_missing_sound_is_reported_once(capsys):
+    manager = AudioManager()
+    manager.play_sound("destroy")   # assets/Sound/destroy.ogg는 저장소에 없음
+    first = capsys.readouterr().out
+    assert "destroy" in first
+    assert "destroy" in manager.missing_sounds
+
+    for _ in range(3): manager.play_sound("destroy")
+    assert capsys.readouterr().out == ""
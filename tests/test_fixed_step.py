@@ -0,0 +1,34 @@
+# test_fixed_step.py - FixedStepAccumulator의 스텝 수, 따라잡기 상한, 보간 비율을 확인합니다.
+
+import pytest
+from stage_simulation import FixedStepAccumulator
+
+def test_steps_follow_elapsed_time():
+    stepper = FixedStepAccumulator(physics_hz=60, max_steps=8)
+    assert stepper.advance(1 / 60) == 1
+    assert stepper.advance(0.5 / 60) == 0
+    assert stepper.alpha == pytest.approx(0.5)
+    assert stepper.advance(0.5 / 60) == 1
+    assert stepper.alpha == pytest.approx(0.0, abs=1e-9)
+    assert sum(stepper.advance(1 / 144) for _ in range(144)) in (59, 60)   # 렌더링이 물리보다 빨라도 초당 60스텝
+
+def test_slow_frame_is_clamped():
+    """긴 프레임 뒤에는 max_steps만 돌리고 남은 시간은 한 스텝 이하만 남깁니다."""
+    stepper = FixedStepAccumulator(physics_hz=60, max_steps=8)
+    assert stepper.advance(2.0) == 8
+    assert 0.0 <= stepper.accumulator <= stepper.step_dt
+    assert stepper.advance(0.0) <= 1   # 다음 프레임에 따라잡기가 이어지지 않음
+
+@pytest.mark.parametrize("frame_dt", [0.0, 0.001, 1 / 60, 0.03, 0.25, 5.0])
+def test_alpha_stays_in_unit_range(frame_dt):
+    stepper = FixedStepAccumulator(physics_hz=60, max_steps=8)
+    for _ in range(5):
+        stepper.advance(frame_dt)
+        assert 0.0 <= stepper.alpha <= 1.0
+
+def test_reset_discards_paused_time():
+    stepper = FixedStepAccumulator(physics_hz=60, max_steps=8)
+    stepper.advance(0.9 / 60)
+    stepper.reset()
+    assert stepper.alpha == 0.0
+    assert stepper.advance(0.5 / 60) == 0
@@ -0,0 +1,39 @@
+# test_font_registry.py - 해상도를 오가도 폰트 레지스트리가 이전 해상도의 Font를 쌓아 두지 않는지 확인합니다.
+
+import pygame
+import pytest
+import settings
+from settings import FONT_SPECS, font_registry, init_fonts, scale_font
+
+@pytest.fixture
+def restore_resolution():
+    pygame.font.init()
+    original = (settings.WIDTH, settings.HEIGHT)
+    yield
+    settings.set_resolution(*original)
+    init_fonts()
+
+def use_all_fonts():
+    fonts = init_fonts()
+    for name in FONT_SPECS: fonts[name]
+    font_registry.sysfont("arial", scale_font(20))
+    return fonts
+
+def test_toggling_resolution_keeps_registry_bounded(restore_resolution):
+    counts = []
+    for resolution in [(1280, 720), (1920, 1080)] * 3:
+        settings.set_resolution(*resolution)
+        fonts = use_all_fonts()
+        counts.append(len(font_registry.fonts))
+        assert set(font_registry.used_at.values()) == {resolution}
+        assert all(font in font_registry.fonts.values() for font in fonts.values())
+    assert counts[2:] == counts[:2] * 2
+
+def test_fonts_shared_by_both_resolutions_survive(restore_resolution):
+    settings.set_resolution(1280, 720)
+    small = font_registry.font(1)          # 배율을 적용해도 두 해상도에서 같은 크기
+    settings.set_resolution(1282, 721)
+    assert scale_font(1) == 1
+    assert font_registry.font(1) is small
+    init_fonts()
+    assert font_registry.font(1) is small
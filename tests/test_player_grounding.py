@@ -0,0 +1,56 @@
+# test_player_grounding.py - 플레이어 접지 판정이 접촉 법선의 변화를 따라가는지 확인합니다.
+
+import pymunk
+from settings import *
+from game_objects import Player, create_static_body
+
+STEP_DT = 1.0 / PHYSICS_HZ
+
+def make_space_with_box():
+    """윗면 왼쪽 모서리가 (200, 300)인 정적 상자 하나가 있는 공간."""
+    space = pymunk.Space()
+    space.gravity = (0, 900)
+    create_static_body(space, (300, 350), (200, 100), TERRAIN_CATEGORY, pymunk.ShapeFilter.ALL_MASKS())
+    return space
+
+def step(space, player, move_speed):
+    player.update(space, STEP_DT)
+    player.set_horizontal_velocity(move_speed)
+    for _ in range(PHYSICS_SUBSTEPS): space.step(STEP_DT / PHYSICS_SUBSTEPS)
+
+def test_grounded_after_rolling_from_corner_onto_top():
+    """모서리에 비스듬히(법선 y 성분 < 0.7) 닿은 뒤 떨어지지 않고 윗면 쪽으로 올라서면 접지로 봐야 합니다."""
+    space = make_space_with_box()
+    radius = scale_x(20)
+    player = Player(space, (200 - radius * 0.8, 300 - radius * 0.6))
+    step(space, player, 300)
+    (box_shape, supports), = player.contact_supports.items()
+    assert not supports and player.ground_contacts == 0   # 처음에는 옆면에 가까운 접촉
+
+    for _ in range(10):
+        step(space, player, 300)
+        assert list(player.contact_supports) == [box_shape]   # 접촉이 끊기지 않음
+        if player.is_grounded: break
+    assert player.is_grounded
+    assert player.ground_contacts == 1
+
+def test_side_contact_is_not_ground():
+    """벽 옆면에만 닿아 있으면 접지가 아니므로 벽 점프를 할 수 없습니다."""
+    space = make_space_with_box()
+    radius = scale_x(20)
+    player = Player(space, (200 - radius, 380))
+    for _ in range(3): step(space, player, 300)
+    assert player.contact_supports
+    assert not player.is_grounded
+    assert player.ground_contacts == 0
+
+def test_ground_contact_counter_returns_to_zero_after_jump():
+    space = make_space_with_box()
+    player = Player(space, (300, 300 - scale_x(20) - 2))
+    for _ in range(5): step(space, player, 0)
+    assert player.is_grounded and player.ground_contacts == 1
+    player.buffer_jump()
+    assert player.jump()
+    for _ in range(5): step(space, player, 0)
+    assert player.ground_contacts == 0 and not player.contact_supports
+    assert not player.is_grounded
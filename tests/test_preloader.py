@@ -0,0 +1,39 @@
+# test_preloader.py - 로딩 화면이 같은 글자를 매 프레임 다시 렌더링하지 않는지 확인합니다.
+
+import pygame
+import pytest
+from preloader import run_loading_splash
+
+class CountingFont:
+    def __init__(self, font):
+        self.font, self.rendered = font, []
+    def render(self, text, antialias, color):
+        self.rendered.append(text)
+        return self.font.render(text, antialias, color)
+
+class SlowPreloader:
+    """프레임마다 진행 상황을 돌려주고, 두 프레임에 한 번씩만 작업이 끝나는 가짜 preloader."""
+    def __init__(self, total):
+        self.frames, self.total, self.finished = 0, total, False
+    @property
+    def critical_progress(self):
+        self.frames += 1
+        return min(self.frames // 2, self.total), self.total
+    def wait_critical(self, timeout): pass
+    def finish_critical(self): self.finished = True
+
+@pytest.fixture
+def screen():
+    pygame.display.init(); pygame.font.init()
+    yield pygame.display.set_mode((320, 240))
+    pygame.display.quit()
+
+def test_splash_renders_each_label_once(screen):
+    font = pygame.font.Font(None, 20)
+    fonts = {'title_large': CountingFont(font), 'body_small': CountingFont(font)}
+    preloader = SlowPreloader(total=3)
+    run_loading_splash(screen, pygame.time.Clock(), fonts, preloader)
+
+    assert preloader.finished and preloader.frames > 4
+    assert fonts['title_large'].rendered == ["Animal Bridge"]
+    assert fonts['body_small'].rendered == [f"로딩 중... {done}/3" for done in range(4)]
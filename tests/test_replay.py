@@ -0,0 +1,82 @@
+# test_replay.py - 기록한 세션을 리플레이로 다시 돌리면 같은 결과가 나오는지 확인합니다.
+
+import json
+
+import pytest
+import settings
+from settings import *
+from game_objects import clear_animal_templates
+from stage_simulation import StageSimulation, get_stage_simulation, clear_stage_simulations
+from replay import ReplayRecorder, load_replay, play_replay, iter_replay_inputs, main as replay_main
+from test_stage_simulation import scripted_inputs, STEP_DT
+
+def body_trace(sim):
+    return (tuple(sim.player.body.position), [tuple(a.body.position) for a in sim.game_objects])
+
+def record_session(sim, steps=300):
+    """game_play_logic처럼 스텝마다 입력을 기록한 뒤 시뮬레이션을 진행합니다. (기록기, 스텝별 위치)를 반환합니다."""
+    recorder, trace = ReplayRecorder(sim.stage_level), []
+    for step_index in range(steps):
+        inputs = scripted_inputs(sim, step_index)
+        recorder.record(sim.step_count, inputs)
+        sim.step(STEP_DT, inputs)
+        trace.append(body_trace(sim))
+        if sim.is_cleared: break
+    return recorder, trace
+
+def assert_reproduces(sim, recorder, trace, path):
+    """저장한 리플레이를 새 시뮬레이션에서 재생해 결과와 스텝별 위치가 모두 같은지 확인합니다."""
+    replayed_trace = []
+    _, matched = play_replay(load_replay(recorder.save(sim, path)), on_step=lambda replayed, events: replayed_trace.append(body_trace(replayed)))
+    assert matched
+    assert replayed_trace == trace
+
+@pytest.fixture(autouse=True)
+def fresh_stage_cache():
+    clear_stage_simulations()
+    yield
+    clear_stage_simulations()
+
+def test_round_trip_first_session(tmp_path):
+    sim = get_stage_simulation("1")
+    assert_reproduces(sim, *record_session(sim), str(tmp_path / "first.json"))
+
+@pytest.mark.parametrize("stage_level", ["1", "10"])
+def test_round_trip_after_restart(tmp_path, stage_level):
+    """게임에서처럼 재사용한 시뮬레이션(다시 시작, 스테이지 재진입)으로 기록해도 재현되어야 합니다."""
+    sim = get_stage_simulation(stage_level)
+    record_session(sim, 60)   # 플레이어가 발판에 닿아 있는 도중에 다시 시작
+    sim.restart()
+    assert_reproduces(sim, *record_session(sim), str(tmp_path / "retry.json"))
+
+    sim = get_stage_simulation(stage_level)   # 스테이지 재진입
+    assert_reproduces(sim, *record_session(sim), str(tmp_path / "reentry.json"))
+
+def test_recorded_inputs_expand_to_original_inputs():
+    sim = get_stage_simulation("3")
+    recorder, _ = record_session(sim, 120)
+    replay = json.loads(json.dumps(recorder.to_dict(sim)))
+    expanded = list(iter_replay_inputs(replay))
+    assert len(expanded) == 120
+    for step_index, inputs in enumerate(expanded):
+        expected = scripted_inputs(sim, step_index)
+        assert inputs["move"] == expected["move"] and inputs["jump"] == expected["jump"]
+        assert [(name, tuple(pos), angle) for name, pos, angle in inputs["drops"]] == \
+               [(name, tuple(pos), angle) for name, pos, angle in expected["drops"]]
+
+def test_replay_uses_recorded_resolution(tmp_path):
+    """해상도를 바꾼 뒤 기록한 세션은 CLI가 기록 해상도로 바꿔 재생해야 재현됩니다."""
+    base_size = (settings.WIDTH, settings.HEIGHT)
+    try:
+        settings.set_resolution(1600, 900); clear_animal_templates()
+        sim = StageSimulation("10", headless=True)
+        recorder, _ = record_session(sim)
+        path = recorder.save(sim, str(tmp_path / "stage10_1600.json"))
+
+        settings.set_resolution(*base_size); clear_animal_templates()
+        with pytest.raises(ValueError):
+            play_replay(load_replay(path))
+        assert replay_main([path]) == 0
+        assert (settings.WIDTH, settings.HEIGHT) == (1600, 900)
+    finally:
+        settings.set_resolution(*base_size); clear_animal_templates()
@@ -0,0 +1,49 @@
+# test_sprite_cache.py - RotationCache의 회전 결과와 메모리 상한(고정 이미지 포함)을 확인합니다.
+
+import pygame
+from sprite_cache import RotationCache
+
+def make_image(size=(32, 32)):
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill((255, 255, 255, 255))
+    return image
+
+def rotation_bytes(image, angles):
+    return sum(RotationCache._surface_bytes(pygame.transform.rotate(image, angle)) for angle in angles)
+
+def test_matches_transform_rotate_on_bucket_angles():
+    image = make_image((20, 10))
+    cache = RotationCache(step_degrees=2)
+    for angle in (0, 90, 180, 270, 4, -36):
+        assert cache.rotated("cat", image, angle).get_size() == pygame.transform.rotate(image, angle).get_size()
+    assert cache.rotated("cat", image, 90.8) is cache.rotated("cat", image, 90)   # 같은 구간은 같은 Surface
+
+def test_pinned_variants_count_toward_budget():
+    image = make_image()
+    pinned = 4 * RotationCache._surface_bytes(image)
+    budget = pinned + rotation_bytes(image, (2, 4))
+    cache = RotationCache(step_degrees=2, max_bytes=budget, max_pinned_bytes=pinned)
+    for angle in (2, 4):
+        cache.rotated("cat", image, angle)
+    assert cache.pinned_bytes == pinned
+    assert cache.used_bytes == budget and len(cache.entries) == 2
+
+    cache.rotated("cat", image, 6)                     # 고정 이미지가 예산을 차지하므로 가장 오래된 구간을 내보냄
+    assert ("cat", (32, 32), 1) not in cache.entries
+    assert cache.used_bytes <= cache.max_bytes
+    assert set(cache.axis_variants[("cat", (32, 32))]) == {0, 90, 180, 270}   # 고정 이미지는 남음
+
+def test_pinned_cap_leaves_room_for_rotations():
+    image = make_image()
+    pinned_set = 4 * RotationCache._surface_bytes(image)
+    lru_room = rotation_bytes(image, (2, 4, 6))
+    cache = RotationCache(step_degrees=2, max_bytes=2 * pinned_set + lru_room, max_pinned_bytes=2 * pinned_set)
+    for index in range(10):
+        cache.rotated(f"animal{index}", image, 0)
+    assert len(cache.axis_variants) == 2               # 상한까지만 고정
+    assert cache.pinned_bytes <= cache.max_pinned_bytes
+
+    for angle in (2, 4, 6):
+        cache.rotated("animal0", image, angle)
+    assert [key[2] for key in cache.entries if key[0] == "animal0"] == [1, 2, 3]   # 새 회전이 바로 밀려나지 않음
+    assert cache.used_bytes <= cache.max_bytes
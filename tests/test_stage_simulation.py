@@ -0,0 +1,73 @@
+# test_stage_simulation.py - StageSimulation 재시작이 새로 만든 시뮬레이션과 같은지 확인합니다.
+
+import pytest
+from settings import *
+from stage_simulation import StageSimulation, get_stage_simulation, clear_stage_simulations
+
+STEP_DT = 1.0 / PHYSICS_HZ
+
+def scripted_inputs(sim, step_index):
+    """이동/점프/블록 설치가 섞인 고정 입력."""
+    inputs = {"move": 1 if (step_index // 40) % 2 == 0 else -1, "jump": step_index % 50 == 10, "drops": []}
+    if step_index == 5: inputs["drops"] = [(sim.available_animals[0], (scale_x(400), scale_y(200)), 0)]
+    if step_index == 30: inputs["drops"] = [(sim.available_animals[1], (scale_x(600), scale_y(150)), 90)]
+    return inputs
+
+def run_trace(sim, steps=240):
+    trace = []
+    for step_index in range(steps):
+        sim.step(STEP_DT, scripted_inputs(sim, step_index))
+        trace.append((tuple(sim.player.body.position), tuple(sim.player.body.velocity),
+                      [(tuple(a.body.position), a.body.angle) for a in sim.game_objects]))
+    return trace
+
+@pytest.mark.parametrize("stage_level", ["1", "3", "10"])
+@pytest.mark.parametrize("played_steps", [1, 37, 60, 400])
+def test_restarted_trace_matches_fresh(stage_level, played_steps):
+    fresh = run_trace(StageSimulation(stage_level, headless=True))
+
+    sim = StageSimulation(stage_level, headless=True)
+    run_trace(sim, played_steps)   # 블록과 지형에 닿아 있는 도중에 재시작
+    sim.restart()
+    assert run_trace(sim) == fresh
+
+def test_reentered_stage_matches_first_attempt():
+    clear_stage_simulations()
+    try:
+        first = run_trace(get_stage_simulation("2"), 120)
+        assert run_trace(get_stage_simulation("2"), 120) == first
+    finally:
+        clear_stage_simulations()
+
+def test_drop_sound_only_on_first_contact(monkeypatch):
+    """떨어진 블록은 부딪힐 때 'drop'을 내고, 쌓인 뒤 닿아 있는 동안에는 충격량을 다시 재지 않습니다."""
+    impulse_reads = []
+    class CountingArbiter:
+        def __init__(self, arbiter): self.arbiter = arbiter
+        def __getattr__(self, name):
+            if name == "total_impulse": impulse_reads.append(name)
+            return getattr(self.arbiter, name)
+    impact = StageSimulation._on_animal_impact
+    monkeypatch.setattr(StageSimulation, "_on_animal_impact", lambda self, arbiter, space, data: impact(self, CountingArbiter(arbiter), space, data))
+
+    sim = StageSimulation("1", headless=True)
+    drop_steps = []
+    for step_index in range(150):
+        inputs = {"move": 0, "drops": [(sim.available_animals[0], (scale_x(400), scale_y(200)), 0)] if step_index == 0 else []}
+        if 'drop' in sim.step(STEP_DT, inputs): drop_steps.append(step_index)
+    assert len(drop_steps) == 1
+
+    impulse_reads.clear()
+    for _ in range(60):
+        assert 'drop' not in sim.step(STEP_DT, {"move": 0})
+    assert impulse_reads == []   # 가만히 놓인 블록의 접촉은 충격량을 다시 재지 않음
+
+def test_flag_uses_compiled_geometry(monkeypatch):
+    """깃발 모양은 컴파일된 스테이지에서 한 번만 계산하고, 시뮬레이션을 만들 때는 다시 계산하지 않습니다."""
+    import game_objects
+    from compiled_stage import get_compiled_stage
+    stage = get_compiled_stage("1")
+    monkeypatch.setattr(game_objects, "flag_geometry", lambda base_pos: pytest.fail("flag_geometry가 다시 불림"))
+    sim = StageSimulation("1", headless=True)
+    assert sim.goal_flag.pole_rect is stage.flag_pole_rect
+    assert sim.goal_flag.cloth_points is stage.flag_cloth_points
@@ -0,0 +1,45 @@
+# test_texture_atlas.py - pack_images가 스프라이트를 겹치지 않게 배치하고 픽셀을 그대로 옮기는지 확인합니다.
+
+import pygame
+import pytest
+from texture_atlas import pack_images
+
+def make_sprite(size, color, alpha=True):
+    surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+    surface.fill(color)
+    return surface
+
+@pytest.fixture
+def sprites():
+    return {
+        "wide": make_sprite((40, 10), (255, 0, 0, 255)),
+        "tall": make_sprite((12, 30), (0, 255, 0, 128)),
+        "square": make_sprite((20, 20), (0, 0, 255, 255)),
+        "tiny": make_sprite((3, 3), (10, 20, 30, 0)),
+        "opaque": make_sprite((25, 8), (200, 100, 50), alpha=False),
+    }
+
+@pytest.mark.parametrize("max_width", [40, 64, 1024])
+def test_regions_cover_sheet_without_overlap(sprites, max_width):
+    sheet, regions = pack_images(sprites, max_width=max_width, padding=1)
+    sheet_rect = sheet.get_rect()
+    assert set(regions) == set(sprites)
+    for name, rect in regions.items():
+        assert rect.size == sprites[name].get_size()
+        assert sheet_rect.contains(rect)
+        assert rect.right <= max_width
+    rects = list(regions.values())
+    for i, rect in enumerate(rects):
+        assert all(not rect.colliderect(other) for other in rects[i + 1:])
+
+def test_regions_hold_original_pixels(sprites):
+    sheet, regions = pack_images(sprites, max_width=64, padding=1)
+    for name, rect in regions.items():
+        original = sprites[name]
+        packed = sheet.subsurface(rect)
+        for point in [(0, 0), (rect.width - 1, rect.height - 1), (rect.width // 2, rect.height // 2)]:
+            assert packed.get_at(point) == original.get_at(point), (name, point)
+
+def test_too_wide_sprite_is_rejected(sprites):
+    with pytest.raises(ValueError):
+        pack_images(sprites, max_width=32)
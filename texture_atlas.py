@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# texture_atlas.py - 텍스처 아틀라스 로더 및 패커
+#
+# TextureAtlas XML(<TextureAtlas imagePath="..."><SubTexture name x y width height/>...)을 읽어
+# 시트 이미지를 한 번만 디코딩하고, 개별 스프라이트는 subsurface(복사 없는 뷰)로 나눠 줍니다.
+# 이 파일을 직접 실행하면 동물 이미지, 타일, 아이콘을 몇 장의 아틀라스로 묶어 assets/atlas/에 씁니다.
+# 게임은 load_sprite()로 이미지를 얻으며, 아틀라스에 없는 이미지는 기존처럼 개별 파일에서 읽습니다.
+#
+# 사용 예:
+#   python texture_atlas.py                 # assets/atlas/*.png, *.xml 다시 생성
+#   python texture_atlas.py --max-width 512
+
+import os
+import sys
+import glob
+import argparse
+import xml.etree.ElementTree as ET
+
+import pygame
+from settings import resource_path
+from asset_pack import get_asset_pack
+
+ATLAS_DIR = os.path.join('assets', 'atlas')
+ATLAS_PADDING = 1   # 스프라이트 사이 여백(px)
+
+# 아틀라스 이름 -> 묶을 이미지 경로 패턴 (게임 폴더 기준)
+ATLAS_SOURCES = {
+    "animals": [os.path.join('assets', 'img', '*.png')],
+    "tiles": [os.path.join('assets', 'Tilemap', 'tile_*.png')],
+    "icons": [os.path.join('assets', 'Icons', '*.png')],
+}
+
+def normalize_name(path):
+    """아틀라스 안의 스프라이트 이름은 게임 폴더 기준 경로를 '/'로 이은 문자열입니다."""
+    return os.path.normpath(path).replace(os.sep, '/')
+
+# ======================================================================================
+# 아틀라스 로더
+# ======================================================================================
+class TextureAtlas:
+    """시트 이미지 한 장과 스프라이트 영역 목록. get()은 시트를 공유하는 subsurface를 돌려줍니다.
+
+    subsurface는 시트의 픽셀을 그대로 가리키므로 돌려받은 이미지를 직접 수정하면 안 됩니다.
+    (scale, rotate처럼 새 Surface를 만드는 변환은 괜찮습니다.)
+    """
+
+    def __init__(self, image, regions):
+        self.image = image
+        self.regions = regions          # 이름 -> pygame.Rect
+        self.subsurfaces = {}
+
+    @classmethod
+    def load(cls, xml_path):
+        return cls.from_decoded(*read_atlas(xml_path))
+
+    @classmethod
+    def from_decoded(cls, image, regions):
+        """read_atlas()의 결과로 아틀라스를 만듭니다. convert_alpha()를 하므로 메인 스레드에서 호출합니다."""
+        if pygame.display.get_surface() is not None: image = image.convert_alpha()
+        return cls(image, regions)
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def names(self):
+        return list(self.regions)
+
+    def get(self, name):
+        surface = self.subsurfaces.get(name)
+        if surface is None:
+            surface = self.subsurfaces[name] = self.image.subsurface(self.regions[name])
+        return surface
+
+def read_atlas(xml_path):
+    """XML을 읽고 시트 이미지를 디코딩해 (convert 전 이미지, 이름 -> Rect)를 반환합니다. 작업 스레드에서 불러도 됩니다."""
+    root = ET.parse(xml_path).getroot()
+    directory = os.path.dirname(xml_path)
+    image_path = os.path.join(directory, root.get("imagePath", ""))
+    if not os.path.isfile(image_path):
+        # imagePath가 실제 파일명과 다른 시트(sheet.png ↔ sheet_white1x.png)는 XML과 같은 이름의 PNG를 씁니다.
+        image_path = os.path.splitext(xml_path)[0] + ".png"
+    image = pygame.image.load(image_path)
+
+    regions = {}
+    for sub in root.iter("SubTexture"):
+        regions[sub.get("name")] = pygame.Rect(int(sub.get("x")), int(sub.get("y")), int(sub.get("width")), int(sub.get("height")))
+    return image, regions
+
+_loaded_atlases = None
+_pending_atlases = None   # preload_atlases()로 맡긴 [(XML 경로, Future), ...]
+
+def _packed_atlas_names():
+    pack = get_asset_pack()
+    return pack.atlas_names() if pack is not None else []
+
+def atlas_xml_paths():
+    return sorted(glob.glob(os.path.join(resource_path(ATLAS_DIR), "*.xml")))
+
+def preload_atlases(executor):
+    """아틀라스 디코딩을 executor 스레드에 맡기고 Future 목록을 반환합니다. 등록은 get_atlases()가 합니다."""
+    global _pending_atlases
+    if _loaded_atlases is not None or _packed_atlas_names(): return []
+    if _pending_atlases is None:
+        _pending_atlases = [(xml_path, executor.submit(read_atlas, xml_path)) for xml_path in atlas_xml_paths()]
+    return [future for _, future in _pending_atlases]
+
+def get_atlases():
+    """assets/atlas/의 아틀라스를 처음 호출할 때 한 번만 로드합니다. 미리 디코딩해 둔 것이 있으면 그 결과를 씁니다.
+
+    에셋 팩에 아틀라스가 있으면 PNG를 풀지 않고 팩의 픽셀로 만듭니다.
+    """
+    global _loaded_atlases, _pending_atlases
+    if _loaded_atlases is None and _packed_atlas_names():
+        pack = get_asset_pack()
+        _loaded_atlases, _pending_atlases = [TextureAtlas.from_decoded(*pack.load_atlas(name)) for name in _packed_atlas_names()], None
+        print(f"✓ 아틀라스 로드 성공 (에셋 팩): {', '.join(_packed_atlas_names())}")
+    if _loaded_atlases is None:
+        pending = _pending_atlases or [(xml_path, None) for xml_path in atlas_xml_paths()]
+        _loaded_atlases, _pending_atlases = [], None
+        for xml_path, future in pending:
+            try:
+                _loaded_atlases.append(TextureAtlas.from_decoded(*(future.result() if future else read_atlas(xml_path))))
+                print(f"✓ 아틀라스 로드 성공: {os.path.basename(xml_path)}")
+            except (pygame.error, OSError, ET.ParseError) as e:
+                print(f"✗ 아틀라스 로드 실패: {os.path.basename(xml_path)} - {e}")
+    return _loaded_atlases
+
+def load_sprite(path):
+    """게임 폴더 기준 경로의 이미지를 아틀라스에서 꺼내고, 없으면 파일에서 직접 읽습니다.
+
+    파일에서 읽을 때는 pygame.image.load().convert_alpha()와 같고, 실패하면 같은 예외를 냅니다.
+    """
+    name = normalize_name(path)
+    for atlas in get_atlases():
+        if name in atlas: return atlas.get(name)
+    return pygame.image.load(resource_path(path)).convert_alpha()
+
+def clear_atlases():
+    """아틀라스를 다시 읽게 합니다 (패커로 다시 만든 뒤 등)."""
+    global _loaded_atlases, _pending_atlases
+    _loaded_atlases = _pending_atlases = None
+
+# ======================================================================================
+# 오프라인 패커
+# ======================================================================================
+def pack_images(named_surfaces, max_width=1024, padding=ATLAS_PADDING):
+    """높이순 선반(shelf) 배치로 이미지를 한 장에 모읍니다. (시트 Surface, 이름 -> Rect)를 반환합니다."""
+    order = sorted(named_surfaces, key=lambda name: (-named_surfaces[name].get_height(), name))
+    regions, x, y, shelf_height, sheet_width = {}, 0, 0, 0, 0
+    for name in order:
+        width, height = named_surfaces[name].get_size()
+        if width > max_width: raise ValueError(f"{name}의 너비({width}px)가 아틀라스 최대 너비({max_width}px)보다 큽니다.")
+        if x > 0 and x + width > max_width:
+            x, y, shelf_height = 0, y + shelf_height + padding, 0
+        regions[name] = pygame.Rect(x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+        sheet_width = max(sheet_width, x - padding)
+
+    sheet = pygame.Surface((max(1, sheet_width), max(1, y + shelf_height)), pygame.SRCALPHA)
+    for name, rect in regions.items():
+        surface = named_surfaces[name]
+        if surface.get_flags() & pygame.SRCALPHA:
+            # 투명한 시트에 더하기로 찍어 반투명 픽셀도 섞이지 않고 그대로 복사되게 합니다.
+            sheet.blit(surface, rect, special_flags=pygame.BLEND_RGBA_ADD)
+        else:
+            # 팔레트 PNG 타일처럼 컬러키로 투명을 나타내는 이미지는 일반 blit으로 키 색을 건너뜁니다.
+            sheet.blit(surface, rect)
+    return sheet, regions
+
+def write_atlas(sheet, regions, xml_path):
+    image_name = os.path.splitext(os.path.basename(xml_path))[0] + ".png"
+    pygame.image.save(sheet, os.path.join(os.path.dirname(xml_path), image_name))
+    root = ET.Element("TextureAtlas", imagePath=image_name)
+    for name, rect in sorted(regions.items()):
+        ET.SubElement(root, "SubTexture", name=name, x=str(rect.x), y=str(rect.y), width=str(rect.width), height=str(rect.height))
+    ET.indent(root, space="\t")
+    ET.ElementTree(root).write(xml_path, encoding="utf-8", xml_declaration=True)
+
+def build_atlases(output_dir=ATLAS_DIR, max_width=1024):
+    os.makedirs(output_dir, exist_ok=True)
+    for atlas_name, patterns in ATLAS_SOURCES.items():
+        paths = sorted(path for pattern in patterns for path in glob.glob(pattern))
+        if not paths:
+            print(f"✗ {atlas_name}: 묶을 이미지가 없습니다.")
+            continue
+        sheet, regions = pack_images({normalize_name(path): pygame.image.load(path) for path in paths}, max_width)
+        write_atlas(sheet, regions, os.path.join(output_dir, f"{atlas_name}.xml"))
+        print(f"✓ {atlas_name}: 이미지 {len(regions)}개 → {sheet.get_width()}x{sheet.get_height()}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Animal Bridge 텍스처 아틀라스 패커")
+    parser.add_argument("--out", default=ATLAS_DIR, help="아틀라스를 쓸 폴더")
+    parser.add_argument("--max-width", type=int, default=1024, help="아틀라스 시트의 최대 너비(px)")
+    args = parser.parse_args(argv)
+    build_atlases(args.out, args.max_width)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,7 @@ import time
 from typing import List, Dict, Optional
 from settings import *
 from settings import resource_path
+from asset_cache import asset_cache
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     try:
@@ -61,10 +62,9 @@ class TerrainRenderer:
         }
 
         for tile_name, filename in tile_files.items():
-            # resource_path를 사용하여 파일의 전체 경로를 가져옵니다.
-            file_path = resource_path(os.path.join(self.assets_path, filename))
+            # 아틀라스에 묶여 있으면 아틀라스에서, 아니면 개별 파일에서 읽습니다.
             try:
-                original_surface = pygame.image.load(file_path).convert_alpha()
+                original_surface = asset_cache.image(os.path.join(self.assets_path, filename))
                 self.tiles[tile_name] = original_surface
                 print(f"✓ 타일 로드 성공: {filename}")
 
@@ -188,8 +188,9 @@ class TerrainRenderer:
         dirt_center = self.scaled_tiles.get('dirt_center')
         if not dirt_center: return
 
-        ground_y = HEIGHT - self.current_tile_size
-        tiles_horizontal = (WIDTH + self.current_tile_size - 1) // self.current_tile_size
+        screen_width, screen_height = screen.get_size()
+        ground_y = screen_height - self.current_tile_size
+        tiles_horizontal = (screen_width + self.current_tile_size - 1) // self.current_tile_size
         for col in range(tiles_horizontal):
             x = col * self.current_tile_size
             tile = self.scaled_tiles.get('dirt_left') if col == 0 else self.scaled_tiles.get('dirt_right') if col == tiles_horizontal - 1 else dirt_center
@@ -2,17 +2,152 @@
 
 import pygame
 import math
+from collections import OrderedDict
 from settings import *
 from settings import resource_path
+from asset_cache import asset_cache
+from frame_profiler import profiler
+
+TEXT_CACHE_MAX_ENTRIES = 512   # 렌더링한 글자 이미지를 이 개수까지 보관합니다.
+OVERLAY_POOL_MAX_ENTRIES = 64  # 반투명 오버레이/패널 Surface를 이 개수까지 보관합니다.
+GEAR_ICON_PATH = "assets/Icons/gear.png"
+
+class TextSurfaceCache:
+    """(폰트, 문자열, 색, 안티앨리어싱)별 font.render() 결과를 보관하는 LRU 캐시입니다.
+
+    같은 글자를 매 프레임 다시 렌더링하지 않도록 UIManager.render_text()가 사용합니다.
+    돌려준 Surface는 여러 곳에서 함께 쓰므로 호출한 쪽에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.entries[key] = font.render(text, antialias, color)
+        if len(self.entries) > self.max_entries: self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """해상도 변경으로 폰트가 새로 만들어지면 이전 폰트로 렌더링한 글자를 버립니다."""
+        self.entries.clear()
+
+    def stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+class OverlaySurfacePool:
+    """(크기, RGBA)별로 한 색으로 채운 SRCALPHA Surface를 재사용하는 풀입니다.
+
+    오버레이와 반투명 패널은 크기와 색이 몇 가지뿐이므로 처음 한 번만 만들고,
+    이후 프레임에서는 새 Surface를 할당하지 않습니다. 해상도가 바뀌면 clear()로 비웁니다.
+    """
+
+    def __init__(self, max_entries=OVERLAY_POOL_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.allocations = self.reuses = 0
+
+    def get(self, size, color_alpha):
+        key = ((int(size[0]), int(size[1])), tuple(color_alpha))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.reuses += 1
+            return surface
+
+        self.allocations += 1
+        surface = self.surfaces[key] = pygame.Surface(key[0], pygame.SRCALPHA)
+        surface.fill(key[1])
+        if len(self.surfaces) > self.max_entries: self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        pooled_bytes = sum(surf.get_width() * surf.get_height() * surf.get_bytesize() for surf in self.surfaces.values())
+        return {"surfaces": len(self.surfaces), "bytes": pooled_bytes, "allocations": self.allocations, "reuses": self.reuses}
+
+class DirtyRegionTracker:
+    """메뉴 화면에서 상태가 바뀐 위젯 영역만 모아 pygame.display.update(rects)로 내보냅니다.
+
+    화면에 들어갈 때 begin_screen()을 한 번 부르고, 매 프레임 track()으로 위젯의 영역과
+    상태(호버, 슬라이더 값, 커서 깜빡임, 스크롤 등)를 알려 줍니다. 바뀐 위젯이 없으면
+    present()는 그리기와 화면 갱신을 모두 건너뜁니다.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.screen_name = None
+        self.widget_states = {}
+        self.dirty_rects = []
+        self.full_redraw = True
+
+    def begin_screen(self, screen_name):
+        self.screen_name = screen_name
+        self.widget_states.clear()
+        self.invalidate()
+
+    def invalidate(self, rect=None):
+        """rect 영역(없으면 화면 전체)을 다음 present()에서 다시 그리게 합니다."""
+        if rect is None:
+            self.full_redraw = True
+            self.dirty_rects.clear()
+        elif not self.full_redraw:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def process_event(self, event):
+        # 창이 가려졌다 다시 보이면 화면 내용이 사라졌을 수 있으므로 전체를 다시 그립니다.
+        if event.type in (pygame.VIDEOEXPOSE, getattr(pygame, 'WINDOWEXPOSED', -1), getattr(pygame, 'WINDOWRESTORED', -1)):
+            self.invalidate()
+
+    def track(self, key, rect, state=None, margin=None):
+        """위젯의 영역/상태를 기록합니다. 그림자와 호버 확대가 들어가도록 margin만큼 넓혀 잡습니다."""
+        margin = scale_x(12) if margin is None else margin
+        area = pygame.Rect(rect).inflate(margin * 2, margin * 2)
+        previous = self.widget_states.get(key)
+        if previous == (area, state): return
+        if previous is not None: self.invalidate(previous[0])
+        self.invalidate(area)
+        self.widget_states[key] = (area, state)
+
+    @property
+    def has_changes(self):
+        return self.full_redraw or bool(self.dirty_rects)
+
+    def present(self, draw):
+        """바뀐 영역이 있을 때만 draw()로 그리고, 그 영역만 화면에 반영합니다. 그렸는지 여부를 반환합니다."""
+        if not self.has_changes: return False
+        if self.full_redraw:
+            draw(); profiler.mark("ui")
+            pygame.display.flip()
+        else:
+            self.screen.set_clip(self.dirty_rects[0].unionall(self.dirty_rects[1:]))
+            draw(); profiler.mark("ui")
+            self.screen.set_clip(None)
+            pygame.display.update(self.dirty_rects)
+        profiler.mark("flip")
+        self.full_redraw, self.dirty_rects = False, []
+        return True
 
 class UIManager:
     def __init__(self, screen):
         self.screen = screen
-        self.font_cache = {}
+        self.text_cache = TextSurfaceCache()
+        self.overlay_pool = OverlaySurfacePool()
         
         # 톱니바퀴 이미지 로드
         try:
-            self.gear_icon = pygame.image.load(resource_path("assets/Icons/gear.png")).convert_alpha()
+            self.gear_icon = asset_cache.image(GEAR_ICON_PATH)
             print("✓ 톱니바퀴 아이콘 로드 성공: gear.png")
         except pygame.error as e:
             print(f"✗ 톱니바퀴 아이콘 로드 실패: {e}")
@@ -20,14 +155,14 @@ class UIManager:
 
     def draw_disabled_overlay(self, rect, alpha=180):
         """rect 위에 반투명 회색 오버레이를 그려 비활성화 효과를 줌"""
-        overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
-        overlay.fill((100, 100, 100, alpha))
-        self.screen.blit(overlay, rect.topleft)
+        self.screen.blit(self.overlay_pool.get(rect.size, (100, 100, 100, alpha)), rect.topleft)
         
     def get_font(self, font_name, size, bold=False, italic=False):
-        key = (font_name, size, bold, italic)
-        if key not in self.font_cache: self.font_cache[key] = pygame.font.SysFont(font_name, size, bold=bold, italic=italic)
-        return self.font_cache[key]
+        return font_registry.sysfont(font_name, size, bold, italic)
+
+    def render_text(self, text, font, color, antialias=True):
+        """font.render()와 같지만 같은 글자는 캐시에서 꺼내 줍니다."""
+        return self.text_cache.render(font, text, color, antialias)
 
     def draw_gear(self, rect, color):
         """톱니바퀴 아이콘을 그립니다. 이미지가 있으면 이미지를, 없으면 도형을 그립니다."""
@@ -38,10 +173,10 @@ class UIManager:
             # 마우스를 올리면 살짝 커지는 효과
             if is_hovered:
                 hover_rect = rect.inflate(rect.width * 0.1, rect.height * 0.1)
-                scaled_image = pygame.transform.smoothscale(self.gear_icon, hover_rect.size)
+                scaled_image = asset_cache.scaled(GEAR_ICON_PATH, hover_rect.size, smooth=True)
                 self.screen.blit(scaled_image, scaled_image.get_rect(center=rect.center))
             else:
-                scaled_image = pygame.transform.smoothscale(self.gear_icon, rect.size)
+                scaled_image = asset_cache.scaled(GEAR_ICON_PATH, rect.size, smooth=True)
                 self.screen.blit(scaled_image, rect)
         else:
             # 이미지를 찾지 못한 경우, 예전 방식으로 도형을 그립니다.
@@ -74,7 +209,7 @@ class UIManager:
         pygame.draw.rect(self.screen, shadow_color, shadow_rect, border_radius=int(scale_x(12)))
         pygame.draw.rect(self.screen, hover_color if is_hovered else base_color, rect, border_radius=int(scale_x(10)))
         pygame.draw.rect(self.screen, BLACK, rect, int(scale_x(2)), border_radius=int(scale_x(10)))
-        text_surf = font.render(text, True, BLACK)
+        text_surf = self.render_text(text, font, BLACK)
         self.screen.blit(text_surf, text_surf.get_rect(center=rect.center))
         return is_hovered
     
@@ -86,7 +221,7 @@ class UIManager:
         self.screen.set_clip(clip_rect)
 
         if is_active or text:
-            text_surf = font.render(text, True, BLACK)
+            text_surf = self.render_text(text, font, BLACK)
             text_rect = text_surf.get_rect()
 
             if text_rect.width > clip_rect.width:
@@ -109,7 +244,7 @@ class UIManager:
                     cursor_bottom = rect.centery + cursor_height / 2
                     pygame.draw.line(self.screen, BLACK, (cursor_x, cursor_top), (cursor_x, cursor_bottom), int(scale_x(2)))
         else:
-            placeholder_surf = placeholder_font.render(placeholder_text, True, PLACEHOLDER_COLOR)
+            placeholder_surf = self.render_text(placeholder_text, placeholder_font, PLACEHOLDER_COLOR)
             placeholder_rect = placeholder_surf.get_rect(midleft=(clip_rect.left, clip_rect.centery))
             self.screen.blit(placeholder_surf, placeholder_rect)
 
@@ -123,17 +258,16 @@ class UIManager:
         if border_width > 0: pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius)
 
     def draw_overlay(self, color_alpha):
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA); overlay.fill(color_alpha)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay_pool.get(self.screen.get_size(), color_alpha), (0, 0))
 
     def draw_centered_text(self, text, font, color, center_pos):
-        text_surf = font.render(text, True, color)
+        text_surf = self.render_text(text, font, color)
         self.screen.blit(text_surf, text_surf.get_rect(center=center_pos))
 
     def draw_centered_text_with_shadow(self, text, font, text_color, shadow_color, center_pos, offset=(3,3)):
         scaled_offset = (scale_x(offset[0]), scale_y(offset[1]))
-        shadow_surf = font.render(text, True, shadow_color)
-        text_surf = font.render(text, True, text_color)
+        shadow_surf = self.render_text(text, font, shadow_color)
+        text_surf = self.render_text(text, font, text_color)
         self.screen.blit(shadow_surf, shadow_surf.get_rect(center=(center_pos[0] + scaled_offset[0], center_pos[1] + scaled_offset[1])))
         self.screen.blit(text_surf, text_surf.get_rect(center=center_pos))
 
@@ -151,15 +285,14 @@ class UIManager:
         return is_hovered
 
     def draw_game_ui_panel(self, rect, alpha=180):
-        ui_panel = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA); ui_panel.fill((200, 200, 200, alpha))
-        self.screen.blit(ui_panel, rect.topleft)
+        self.screen.blit(self.overlay_pool.get(rect.size, (200, 200, 200, alpha)), rect.topleft)
 
     def draw_scrollable_text(self, text_surface, view_rect, scroll_y):
         self.screen.blit(text_surface, view_rect.topleft, (0, scroll_y, view_rect.width, view_rect.height))
     
     def create_text_surface(self, lines, line_spacing=5):
         if not lines: return pygame.Surface((1, 1), pygame.SRCALPHA)
-        surfaces = [font.render(text, True, color) for text, font, color in lines]
+        surfaces = [self.render_text(text, font, color) for text, font, color in lines]
         total_height = sum(s.get_height() for s in surfaces) + max(0, len(surfaces) - 1) * line_spacing
         max_width = max(s.get_width() for s in surfaces)
         surface = pygame.Surface((max_width, total_height), pygame.SRCALPHA)